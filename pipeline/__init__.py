@@ -1,12 +1,48 @@
-"""Pipeline modules for WSDL/XSD to JSON Schema conversion."""
-from .download import download_from_url
-from .generate import generate_dataclasses
-from .convert import convert_to_pydantic
-from .schema import generate_json_schema
+"""Pipeline modules for WSDL/XSD to JSON Schema conversion.
+
+Submodules are imported lazily on first attribute access (PEP 562), so callers
+that only need one stage do not pay for importing the others (e.g. Pydantic
+and xsdata for the convert stage).
+"""
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+if TYPE_CHECKING:
+    from .download import download_from_url, download_many_urls
+    from .generate import generate_dataclasses
+    from .convert import convert_to_pydantic
+    from .schema import generate_json_schema
+
+# Public name -> (submodule, attribute)
+_LAZY_EXPORTS: Dict[str, Tuple[str, str]] = {
+    'download_from_url': ('.download', 'download_from_url'),
+    'download_many_urls': ('.download', 'download_many_urls'),
+    'generate_dataclasses': ('.generate', 'generate_dataclasses'),
+    'convert_to_pydantic': ('.convert', 'convert_to_pydantic'),
+    'generate_json_schema': ('.schema', 'generate_json_schema'),
+}
 
 __all__ = [
     'download_from_url',
+    'download_many_urls',
     'generate_dataclasses',
     'convert_to_pydantic',
     'generate_json_schema',
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule providing ``name`` on first access and cache it."""
+    try:
+        module_name, attribute = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value: Any = getattr(importlib.import_module(module_name, __name__), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """Include lazily exported names in dir(pipeline)."""
+    return sorted(set(globals()) | set(__all__))
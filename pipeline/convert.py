@@ -19,7 +19,17 @@ from typing import Dict, Tuple, Any, Type, Optional, List
 from xsdata.models.datatype import XmlDate, XmlDateTime
 
 from exceptions import ConversionError
-from utils.conversion import dataclass_to_pydantic_model
+from utils.conversion import (
+    GENERATED_MODULE_IMPORTS,
+    dataclass_to_pydantic_model,
+    inspect_dataclass_fields,
+    order_models_by_dependency,
+    render_model_class,
+    render_model_rebuilds,
+    render_type_imports,
+    resolve_forward_refs
+)
+from utils.files import atomic_write_text
 from utils.temp_manager import preserve_sys_path
 
 logger: logging.Logger = logging.getLogger(__name__)
@@ -28,7 +38,8 @@ logger: logging.Logger = logging.getLogger(__name__)
 def convert_to_pydantic(
     module_name: str,
     temp_dir: Path,
-    output_dir: Optional[Path] = None
+    output_dir: Optional[Path] = None,
+    decimal_as_float: bool = False
 ) -> Tuple[Dict[str, Type[Any]], Path]:
     """
     Convert dataclasses from module to Pydantic models.
@@ -41,6 +52,8 @@ def convert_to_pydantic(
         module_name: Fully qualified module name (e.g., 'generated_dataclasses.sample_complex')
         temp_dir: Temporary directory containing generated modules
         output_dir: Directory where Pydantic models file should be saved (default: 'generated')
+        decimal_as_float: If True, map xs:decimal fields to float instead of Decimal.
+                          Faster to validate and serialize, at the cost of precision.
     
     Returns:
         Tuple of (pydantic_models dict, models_output_path):
@@ -70,14 +83,6 @@ def convert_to_pydantic(
             logger.error(error_msg)
             raise ConversionError(error_msg)
         
-        # Find all dataclasses
-        dataclass_types: List[Tuple[str, Type[Any]]] = []
-        for name, obj in inspect.getmembers(module):
-            if inspect.isclass(obj) and is_dataclass(obj):
-                dataclass_types.append((name, obj))
-        
-        logger.info(f"Found {len(dataclass_types)} dataclasses")
-        
         # Create namespace for all types (needed for forward references)
         model_namespace: Dict[str, Any] = {
             'Decimal': Decimal,
@@ -88,12 +93,21 @@ def convert_to_pydantic(
             'Enum': Enum
         }
         
-        # Add all classes from module to namespace
-        for name in dir(module):
-            if not name.startswith('_'):
-                obj = getattr(module, name)
-                if inspect.isclass(obj):
-                    model_namespace[name] = obj
+        # Single pass over the module: collect public classes into the
+        # namespace and dataclasses for conversion, in definition order
+        dataclass_types: List[Tuple[str, Type[Any]]] = []
+        for name, obj in vars(module).items():
+            if name.startswith('_') or not inspect.isclass(obj):
+                continue
+            model_namespace[name] = obj
+            if is_dataclass(obj):
+                dataclass_types.append((name, obj))
+        
+        logger.info(f"Found {len(dataclass_types)} dataclasses")
+        
+        # xsdata emits postponed annotations, so 'Decimal' is resolved from this namespace
+        if decimal_as_float:
+            model_namespace['Decimal'] = float
         
         # First pass: Create all Pydantic models
         pydantic_models: Dict[str, Type[Any]] = {}
@@ -108,9 +122,18 @@ def convert_to_pydantic(
         
         # Second pass: Rebuild models to resolve forward references
         logger.info("Rebuilding models to resolve forward references...")
-        for name, model in pydantic_models.items():
+        # Expose references between models so they can be ordered below
+        for model in pydantic_models.values():
+            resolve_forward_refs(model, model_namespace)
+        
+        # Dependencies first, so each rebuild reuses the already-complete
+        # schemas of the models it references; complete models need no rebuild
+        for name in order_models_by_dependency(pydantic_models):
+            model = pydantic_models[name]
+            if model.__pydantic_complete__:
+                continue
             try:
-                model.model_rebuild(_types_namespace=model_namespace)
+                model.model_rebuild(force=True, _types_namespace=model_namespace)
             except Exception as e:
                 logger.warning(f"Could not rebuild {name}: {e}")
         
@@ -123,39 +146,77 @@ def convert_to_pydantic(
             models_file = Path("generated") / "pydantic_models.py"
             models_file.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(models_file, 'w') as f:
-            f.write('"""\nGenerated Pydantic Models\n\n')
-            f.write(f'Auto-generated from module: {module_name}\n')
-            f.write('Do not edit manually.\n"""\n\n')
-            f.write('from pydantic import BaseModel\n')
-            f.write('from typing import Optional, List\n')
-            f.write('from decimal import Decimal\n')
-            f.write('from datetime import datetime, date\n')
-            f.write('from enum import Enum\n')
-            f.write(f'from {module_name} import *\n\n')
-            
-            for name, model in pydantic_models.items():
-                # Get field definitions
-                fields_str: List[str] = []
-                for field_name, field_info in model.model_fields.items():
-                    field_type: str = str(field_info.annotation).replace('typing.', '')
-                    if field_info.is_required():
-                        fields_str.append(f"    {field_name}: {field_type}")
-                    else:
-                        default: Any = field_info.default
-                        if default is None:
-                            fields_str.append(f"    {field_name}: {field_type} = None")
-                        else:
-                            fields_str.append(f"    {field_name}: {field_type} = {repr(default)}")
-                
-                f.write(f"class {name}(BaseModel):\n")
-                if fields_str:
-                    f.write('\n'.join(fields_str))
-                    f.write('\n\n')
-                else:
-                    f.write("    pass\n\n")
+        # Assemble the whole file and write it in one call
+        parts: List[str] = [
+            '"""\nGenerated Pydantic Models\n\n',
+            f'Auto-generated from module: {module_name}\n',
+            'Do not edit manually.\n"""\n\n',
+            GENERATED_MODULE_IMPORTS,
+            render_type_imports(pydantic_models, module_name),
+            '\n',
+        ]
+        
+        # Targets before their aliases; references between classes are
+        # postponed annotations resolved by the trailing model_rebuild() calls
+        aliases: Dict[str, str] = _find_aliases(dataclass_types, pydantic_models)
+        class_names: List[str] = []
+        for name in order_models_by_dependency(pydantic_models, aliases):
+            if name in aliases:
+                parts.append(f"{name} = {aliases[name]}\n\n")
+            else:
+                parts.append(render_model_class(name, pydantic_models[name]))
+                class_names.append(name)
+        parts.append(render_model_rebuilds(class_names))
+        
+        atomic_write_text(models_file, ''.join(parts))
         
         logger.info(f"Converted {len(pydantic_models)} models")
         logger.info(f"Saved to {models_file}")
         
         return pydantic_models, models_file
+
+
+def _find_aliases(
+    dataclass_types: List[Tuple[str, Type[Any]]],
+    pydantic_models: Dict[str, Type[Any]]
+) -> Dict[str, str]:
+    """
+    Find converted dataclasses that can be written as aliases of another model.
+    
+    xsdata emits element wrappers such as ``class Order(OrderType)`` whose body is
+    only a Meta class, and WSDL messages often produce ``OrderRequest`` next to an
+    ``OrderRequestType`` with the same fields. In both cases the generated source
+    binds ``Order = OrderType`` instead of repeating the class body.
+    
+    Args:
+        dataclass_types: (name, dataclass) pairs found in the module
+        pydantic_models: Converted Pydantic models by name
+    
+    Returns:
+        Dictionary mapping alias name to the model name it refers to
+    """
+    dataclass_by_name: Dict[str, Type[Any]] = {
+        name: dataclass_type for name, dataclass_type in dataclass_types
+        if name in pydantic_models
+    }
+    signatures: Dict[str, Tuple[Any, ...]] = {
+        name: tuple(inspect_dataclass_fields(dataclass_type))
+        for name, dataclass_type in dataclass_by_name.items()
+    }
+    
+    aliases: Dict[str, str] = {}
+    for name, dataclass_type in dataclass_by_name.items():
+        candidates: List[str] = [
+            base.__name__ for base in dataclass_type.__bases__ if is_dataclass(base)
+        ]
+        candidates.append(f"{name}Type")
+        for target in candidates:
+            if (
+                target != name
+                and target in signatures
+                and target not in aliases
+                and signatures[target] == signatures[name]
+            ):
+                aliases[name] = target
+                break
+    return aliases
@@ -4,13 +4,21 @@ Pipeline module for downloading WSDL/XSD files from URLs.
 This module provides functionality to download XSD/WSDL files from HTTP/HTTPS URLs,
 with proper timeout handling and error reporting.
 """
+import atexit
+import hashlib
 import logging
+import posixpath
 import requests
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from urllib.parse import urlparse, ParseResult
-from typing import Final
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlparse
+from urllib3.util.retry import Retry
+from typing import Counter, Dict, Final, List, Optional
 
 from exceptions import DownloadError
+from utils.files import atomic_open
 
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -18,9 +26,49 @@ logger: logging.Logger = logging.getLogger(__name__)
 DEFAULT_TIMEOUT: Final[int] = 30
 TEMP_DIR: Final[str] = ".temp"
 DOWNLOADS_SUBDIR: Final[str] = "downloads"
+USER_AGENT: Final[str] = "python-zeep-codegen"
+DOWNLOAD_CHUNK_SIZE: Final[int] = 4 << 20
+DEFAULT_MAX_WORKERS: Final[int] = 8
+MAX_RETRIES: Final[int] = 3
+NAME_TAG_DIGEST_SIZE: Final[int] = 4
 
 
-def download_from_url(url: str, timeout: int = DEFAULT_TIMEOUT) -> Path:
+def _create_session() -> requests.Session:
+    """
+    Create the HTTP session shared by all downloads.
+    
+    A single session keeps connections alive between requests, so fetching a WSDL
+    and the schemas it imports from the same host reuses one pooled connection.
+    Transient gateway errors are retried with a short backoff.
+    
+    Returns:
+        Configured requests.Session
+    """
+    session: requests.Session = requests.Session()
+    # raise_on_status=False hands the last error response back once retries
+    # run out, so raise_for_status() still reports it as "HTTP 503 - ..."
+    retries: Retry = Retry(
+        total=MAX_RETRIES,
+        backoff_factor=0.3,
+        status_forcelist=[502, 503, 504],
+        raise_on_status=False
+    )
+    adapter: HTTPAdapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retries)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers['User-Agent'] = USER_AGENT
+    return session
+
+
+_SESSION: Final[requests.Session] = _create_session()
+atexit.register(_SESSION.close)
+
+
+def download_from_url(
+    url: str,
+    timeout: int = DEFAULT_TIMEOUT,
+    name_tag: Optional[str] = None
+) -> Path:
     """
     Download XSD/WSDL file from HTTP/HTTPS URL to temporary location.
     
@@ -30,6 +78,8 @@ def download_from_url(url: str, timeout: int = DEFAULT_TIMEOUT) -> Path:
     Args:
         url: HTTP/HTTPS URL to download from
         timeout: Request timeout in seconds (default: 30)
+        name_tag: Optional tag inserted before the file extension, used to keep
+                  filenames from different URLs apart (e.g. types-1a2b3c4d.xsd)
     
     Returns:
         Path to downloaded file in temp directory
@@ -46,37 +96,17 @@ def download_from_url(url: str, timeout: int = DEFAULT_TIMEOUT) -> Path:
     logger.info(f"Downloading from URL: {url}")
     
     try:
-        response: requests.Response = requests.get(url, timeout=timeout)
-        response.raise_for_status()
-        
-        # Determine filename from URL or Content-Disposition header
-        parsed_url: ParseResult = urlparse(url)
-        filename: str = Path(parsed_url.path).name
-        
-        # If no filename in URL, use generic name based on content type
-        if not filename or '.' not in filename:
-            content_type: str = response.headers.get('content-type', '')
-            if 'xml' in content_type.lower() or 'wsdl' in url.lower():
-                filename = 'downloaded.wsdl' if 'wsdl' in url.lower() else 'downloaded.xsd'
-            else:
-                filename = 'downloaded.xml'
-        
-        # Save to temp directory (use downloads subdirectory to avoid conflicts)
-        temp_dir: Path = Path(TEMP_DIR)
-        downloads_dir: Path = temp_dir / DOWNLOADS_SUBDIR
-        downloads_dir.mkdir(parents=True, exist_ok=True)
-        file_path: Path = downloads_dir / filename
-        
-        with open(file_path, 'wb') as f:
-            f.write(response.content)
-        
-        logger.info(f"Downloaded: {filename} ({len(response.content)} bytes)")
-        logger.info(f"Saved to: {file_path}")
-        
-        return file_path
+        response: requests.Response = _SESSION.get(url, timeout=timeout, stream=True)
+        try:
+            return _save_response(url, response, name_tag)
+        finally:
+            response.close()
         
     except requests.exceptions.Timeout:
-        error_msg = f"Request timed out after {timeout} seconds"
+        error_msg = (
+            f"Request timed out ({timeout} seconds per attempt, "
+            f"up to {MAX_RETRIES + 1} attempts)"
+        )
         logger.error(error_msg)
         raise DownloadError(error_msg)
     except requests.exceptions.ConnectionError:
@@ -91,3 +121,158 @@ def download_from_url(url: str, timeout: int = DEFAULT_TIMEOUT) -> Path:
         error_msg = f"Error downloading file: {e}"
         logger.error(error_msg)
         raise DownloadError(error_msg)
+
+
+def download_many_urls(
+    urls: List[str],
+    timeout: int = DEFAULT_TIMEOUT,
+    max_workers: int = DEFAULT_MAX_WORKERS
+) -> Dict[str, Path]:
+    """
+    Download several XSD/WSDL files concurrently.
+    
+    Each URL is fetched with download_from_url() on a thread pool sharing the
+    pooled session, so total wall time approaches the slowest download rather
+    than the sum of all of them. Every URL is attempted even if some fail.
+    
+    URLs whose filename would be shared with another URL (same basename on a
+    different path or query), or that have no filename at all, get a short hash
+    of the full URL added to the name, so every URL is saved to its own file.
+    
+    Args:
+        urls: HTTP/HTTPS URLs to download (duplicates are fetched once)
+        timeout: Per-request timeout in seconds (default: 30)
+        max_workers: Maximum number of concurrent downloads (default: 8)
+    
+    Returns:
+        Dictionary mapping each URL to its downloaded file path
+    
+    Raises:
+        DownloadError: If any download fails, listing every failed URL
+    
+    Example:
+        >>> paths = download_many_urls([
+        ...     'https://example.com/service.wsdl',
+        ...     'https://example.com/types.xsd',
+        ... ])
+        >>> print(paths['https://example.com/types.xsd'])
+        .temp/downloads/types.xsd
+    """
+    unique_urls: List[str] = list(dict.fromkeys(urls))
+    if not unique_urls:
+        return {}
+    
+    logger.info(f"Downloading {len(unique_urls)} files")
+    
+    name_tags: Dict[str, Optional[str]] = _name_tags(unique_urls)
+    results: Dict[str, Path] = {}
+    failures: Dict[str, DownloadError] = {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_urls))) as executor:
+        futures = {
+            url: executor.submit(download_from_url, url, timeout, name_tags[url])
+            for url in unique_urls
+        }
+        for url, future in futures.items():
+            try:
+                results[url] = future.result()
+            except DownloadError as e:
+                failures[url] = e
+    
+    if failures:
+        details: str = '; '.join(f"{url}: {error}" for url, error in failures.items())
+        error_msg: str = f"Failed to download {len(failures)} of {len(unique_urls)} files: {details}"
+        logger.error(error_msg)
+        raise DownloadError(error_msg)
+    
+    return results
+
+
+def _url_basename(url: str) -> str:
+    """Return the last path segment of a URL (empty if there is none)."""
+    return posixpath.basename(urlparse(url).path)
+
+
+def _name_tags(urls: List[str]) -> Dict[str, Optional[str]]:
+    """
+    Pick a filename tag for each URL so no two URLs share a destination.
+    
+    URLs with a basename no other URL uses keep their plain filename, so
+    relative schemaLocation references between downloaded files still resolve.
+    The rest are tagged with a hash of the full URL, including the query.
+    
+    Args:
+        urls: Distinct URLs to be downloaded together
+    
+    Returns:
+        Dictionary mapping each URL to its tag, or None to keep the plain name
+    """
+    basenames: Dict[str, str] = {url: _url_basename(url) for url in urls}
+    counts: Counter[str] = Counter(basenames.values())
+    
+    tags: Dict[str, Optional[str]] = {}
+    for url, basename in basenames.items():
+        if '.' in basename and counts[basename] == 1:
+            tags[url] = None
+        else:
+            tags[url] = hashlib.blake2b(
+                url.encode('utf-8'), digest_size=NAME_TAG_DIGEST_SIZE
+            ).hexdigest()
+    return tags
+
+
+def _save_response(
+    url: str,
+    response: requests.Response,
+    name_tag: Optional[str] = None
+) -> Path:
+    """
+    Check a streamed response and write its body to the downloads directory.
+    
+    Args:
+        url: URL the response was fetched from (used to pick a filename)
+        response: Response opened with stream=True
+        name_tag: Optional tag inserted before the file extension
+    
+    Returns:
+        Path to the saved file
+    
+    Raises:
+        requests.exceptions.HTTPError: If the response has an error status
+    """
+    response.raise_for_status()
+    
+    # Determine filename from URL or Content-Disposition header
+    filename: str = _url_basename(url)
+    
+    # If no filename in URL, use generic name based on content type
+    if '.' not in filename:
+        is_wsdl: bool = 'wsdl' in url.lower()
+        is_xml: bool = 'xml' in response.headers.get('content-type', '').lower()
+        if is_wsdl:
+            filename = 'downloaded.wsdl'
+        elif is_xml:
+            filename = 'downloaded.xsd'
+        else:
+            filename = 'downloaded.xml'
+    
+    if name_tag:
+        stem, extension = posixpath.splitext(filename)
+        filename = f"{stem}-{name_tag}{extension}"
+    
+    # Save to temp directory (use downloads subdirectory to avoid conflicts)
+    temp_dir: Path = Path(TEMP_DIR)
+    downloads_dir: Path = temp_dir / DOWNLOADS_SUBDIR
+    downloads_dir.mkdir(parents=True, exist_ok=True)
+    file_path: Path = downloads_dir / filename
+    
+    # Stream the body from urllib3 to disk (it undoes gzip/deflate) rather
+    # than holding it all in memory
+    response.raw.decode_content = True
+    with atomic_open(file_path) as f:
+        shutil.copyfileobj(response.raw, f, DOWNLOAD_CHUNK_SIZE)
+        size: int = f.tell()
+    
+    logger.info(f"Downloaded: {filename} ({size} bytes)")
+    logger.info(f"Saved to: {file_path}")
+    
+    return file_path
@@ -5,9 +5,12 @@ This module handles Step 1 of the conversion pipeline: converting XSD/WSDL schem
 to Python dataclasses using xsdata's CLI tool. The generated dataclasses preserve
 the structure and types from the original schema.
 """
+import hashlib
 import logging
 import subprocess
 import shutil
+import tempfile
+from importlib.metadata import version
 from pathlib import Path
 from typing import Tuple, Optional, Final, List
 
@@ -17,12 +20,19 @@ logger: logging.Logger = logging.getLogger(__name__)
 
 # Constants
 DEFAULT_OUTPUT_PACKAGE: Final[str] = "generated_dataclasses"
+# xsdata already emits kw_only=True; slots drop the per-instance __dict__
+XSDATA_FORMAT_OPTIONS: Final[List[str]] = ["--slots"]
+SCHEMA_SUFFIXES: Final[Tuple[str, ...]] = (".xsd", ".wsdl")
+# Records which schema file, xsdata version and options the package was built from
+SOURCE_MARKER: Final[str] = ".source"
 
 
 def generate_dataclasses(
     xsd_file: str,
     temp_dir: Optional[Path] = None,
-    keep_temp: bool = False
+    keep_temp: bool = False,
+    cache_dir: Optional[Path] = None,
+    force_regenerate: bool = False
 ) -> Tuple[str, Path]:
     """
     Generate Python dataclasses from XSD file using xsdata in a temporary directory.
@@ -35,6 +45,11 @@ def generate_dataclasses(
         xsd_file: Path to XSD or WSDL file (local path or absolute path)
         temp_dir: Temporary directory for generation (will be created if None)
         keep_temp: If True, don't delete temp directory after processing
+        cache_dir: If set, reuse xsdata output stored here for unchanged schemas.
+                   Entries are keyed by the schema files' contents, the xsdata
+                   version and the generation options.
+        force_regenerate: If True, run xsdata even when the generated module in
+                          temp_dir is newer than every schema file
     
     Returns:
         Tuple of (module_name, temp_dir_path):
@@ -55,36 +70,57 @@ def generate_dataclasses(
     if temp_dir is None:
         temp_dir = Path(".temp")
     
+    output_package: str = DEFAULT_OUTPUT_PACKAGE
+    full_module: str = _module_name(xsd_file, output_package)
+    dataclasses_dir: Path = temp_dir / DEFAULT_OUTPUT_PACKAGE
+    
+    # Make-style staleness check: keep output that is newer than its sources
+    generated_file: Path = dataclasses_dir / f"{full_module.rsplit('.', 1)[-1]}.py"
+    if not force_regenerate and _is_up_to_date(generated_file, Path(xsd_file)):
+        logger.info(f"Dataclasses are up to date: {generated_file}")
+        return full_module, temp_dir
+    
     # Clean generated_models subdirectory only (preserve downloads)
     temp_dir.mkdir(parents=True, exist_ok=True)
-    dataclasses_dir: Path = temp_dir / DEFAULT_OUTPUT_PACKAGE
     if dataclasses_dir.exists():
         shutil.rmtree(dataclasses_dir, ignore_errors=True)
     
-    output_package: str = DEFAULT_OUTPUT_PACKAGE
-    
     logger.info(f"Temp directory: {temp_dir}")
     logger.info(f"Output package: {output_package}")
     
+    cache_entry: Optional[Path] = None
+    if cache_dir is not None:
+        cache_entry = Path(cache_dir) / _cache_key(Path(xsd_file))
+        if cache_entry.is_dir():
+            shutil.copytree(cache_entry, dataclasses_dir)
+            _write_source_marker(dataclasses_dir, Path(xsd_file))
+            logger.info(f"Reused cached dataclasses: {cache_entry}")
+            return full_module, temp_dir
+    
     # Run xsdata generate command - it will create files in current dir, so we need to chdir
-    cmd: List[str] = ["xsdata", "generate", "-p", output_package, str(Path(xsd_file).absolute())]
+    cmd: List[str] = [
+        "xsdata", "generate", "-p", output_package,
+        *XSDATA_FORMAT_OPTIONS,
+        str(Path(xsd_file).absolute())
+    ]
     logger.debug(f"Running: {' '.join(cmd)}")
     
-    result: subprocess.CompletedProcess[str] = subprocess.run(
-        cmd, capture_output=True, text=True, cwd=str(temp_dir)
+    # Discard xsdata's progress output; stderr is only decoded on failure
+    result: subprocess.CompletedProcess[bytes] = subprocess.run(
+        cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, cwd=str(temp_dir)
     )
     
     if result.returncode != 0:
-        error_msg: str = f"xsdata generation failed: {result.stderr}"
+        stderr: str = result.stderr.decode('utf-8', 'replace')
+        error_msg: str = f"xsdata generation failed: {stderr}"
         logger.error(error_msg)
         if not keep_temp and temp_dir:
             shutil.rmtree(temp_dir, ignore_errors=True)
         raise XSDGenerationError(error_msg)
     
-    # Derive module name from XSD filename
-    xsd_path: Path = Path(xsd_file)
-    module_name: str = xsd_path.stem.replace('-', '_').replace('.', '_')
-    full_module: str = f"{output_package}.{module_name}"
+    if cache_entry is not None:
+        _store_in_cache(dataclasses_dir, cache_entry)
+    _write_source_marker(dataclasses_dir, Path(xsd_file))
     
     logger.info(f"Generated dataclasses in temp directory")
     logger.info(f"Module: {full_module}")
@@ -92,3 +128,126 @@ def generate_dataclasses(
         logger.info(f"Temp directory preserved: {temp_dir}")
     
     return full_module, temp_dir
+
+
+def _module_name(xsd_file: str, output_package: str) -> str:
+    """Derive the generated module's dotted name from the XSD filename."""
+    module_name: str = Path(xsd_file).stem.replace('-', '_').replace('.', '_')
+    return f"{output_package}.{module_name}"
+
+
+def _schema_files(xsd_path: Path) -> List[Path]:
+    """
+    List the schema files that generation from xsd_path may depend on.
+    
+    Imports and includes are usually resolved relative to the input file, so
+    this is the input plus its sibling .xsd/.wsdl files, sorted by name.
+    """
+    return sorted(
+        path for path in xsd_path.absolute().parent.iterdir()
+        if path.suffix.lower() in SCHEMA_SUFFIXES and path.is_file()
+    )
+
+
+def _is_up_to_date(generated_file: Path, xsd_path: Path) -> bool:
+    """
+    Check whether generated_file was built from xsd_path and is still fresh.
+    
+    Args:
+        generated_file: Module xsdata writes for xsd_path
+        xsd_path: Input XSD/WSDL file
+    
+    Returns:
+        True if the generated module exists, came from the same input file,
+        xsdata version and options, and is at least as new as every schema
+        file it may depend on
+    """
+    try:
+        marker: Path = generated_file.parent / SOURCE_MARKER
+        if marker.read_text(encoding='utf-8') != _source_marker_text(xsd_path):
+            return False
+        generated_mtime: int = generated_file.stat().st_mtime_ns
+        source_mtime: int = max(
+            (path.stat().st_mtime_ns for path in _schema_files(xsd_path)),
+            default=xsd_path.stat().st_mtime_ns
+        )
+    except OSError:
+        return False
+    return generated_mtime >= source_mtime
+
+
+def _generator_settings() -> Tuple[str, str]:
+    """Return the xsdata version and generation options that shape the output."""
+    return version("xsdata"), " ".join(XSDATA_FORMAT_OPTIONS)
+
+
+def _source_marker_text(xsd_path: Path) -> str:
+    """Describe the input file and generator settings, one per line."""
+    return '\n'.join((str(xsd_path.absolute()), *_generator_settings()))
+
+
+def _write_source_marker(dataclasses_dir: Path, xsd_path: Path) -> None:
+    """Record the input file and generator settings the package was built from."""
+    if dataclasses_dir.is_dir():
+        (dataclasses_dir / SOURCE_MARKER).write_text(
+            _source_marker_text(xsd_path), encoding='utf-8'
+        )
+
+
+def _cache_key(xsd_path: Path) -> str:
+    """
+    Compute the cache key for generating dataclasses from a schema file.
+    
+    The input's sibling schema files are included (see _schema_files()).
+    
+    Args:
+        xsd_path: Input XSD/WSDL file
+    
+    Returns:
+        Hex digest identifying the generation inputs
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for setting in _generator_settings():
+        digest.update(setting.encode())
+    digest.update(xsd_path.name.encode())
+    
+    for path in _schema_files(xsd_path):
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    
+    return digest.hexdigest()
+
+
+def _store_in_cache(dataclasses_dir: Path, cache_entry: Path) -> None:
+    """
+    Copy freshly generated dataclasses into the cache, ignoring failures.
+    
+    Each call stages into its own mkdtemp() directory beside the entry and
+    renames it into place, so concurrent runs storing the same key never
+    touch each other's files and a partial tree is never published. Losing
+    the rename race to another run counts as success: its entry has the
+    same contents.
+    
+    Args:
+        dataclasses_dir: Generated package to cache
+        cache_entry: Cache directory for this schema's key
+    """
+    staging: Optional[Path] = None
+    try:
+        cache_entry.parent.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(
+            prefix=f"{cache_entry.name}.", suffix=".tmp", dir=cache_entry.parent
+        ))
+        # copytree also copies the package's permissions over mkdtemp's 0700
+        shutil.copytree(dataclasses_dir, staging, dirs_exist_ok=True)
+        staging.rename(cache_entry)
+        staging = None
+        logger.debug(f"Cached dataclasses: {cache_entry}")
+    except OSError as e:
+        if cache_entry.is_dir():
+            logger.debug(f"Dataclasses already cached by another run: {cache_entry}")
+        else:
+            logger.warning(f"Could not cache generated dataclasses: {e}")
+    finally:
+        if staging is not None:
+            shutil.rmtree(staging, ignore_errors=True)
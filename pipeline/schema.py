@@ -5,14 +5,20 @@ This module handles Step 3 of the conversion pipeline: taking Pydantic models
 and generating a unified JSON Schema document with all type definitions in $defs.
 """
 import logging
-import json
+import os
 from pathlib import Path
-from typing import Dict, Type, Any, Optional, List
+from itertools import islice
+from typing import Dict, Final, Type, Any, Optional, Tuple
 
 from exceptions import SchemaGenerationError
+from utils.conversion import cached_json_schema
+from utils.serialization import write_json
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+# Number of nested type names listed in the log output
+TYPES_PREVIEW_LIMIT: Final[int] = 8
+
 
 def generate_json_schema(
     pydantic_models: Dict[str, Type[Any]],
@@ -54,7 +60,7 @@ def generate_json_schema(
     main_model: Type[Any] = pydantic_models[main_model_name]
     
     # Generate unified schema
-    schema: Dict[str, Any] = main_model.model_json_schema()
+    schema: Dict[str, Any] = cached_json_schema(main_model)
     
     # Ensure output directory exists and clean old schemas
     if output_dir:
@@ -65,25 +71,29 @@ def generate_json_schema(
         schema_path = Path("schemas") / "unified_schema.json"
         schema_path.parent.mkdir(parents=True, exist_ok=True)
     
-    # Remove old schema files in this directory
-    if schema_path.parent.exists():
-        for old_file in schema_path.parent.glob("*.json"):
-            old_file.unlink()
-            logger.debug(f"Removed old file: {old_file.name}")
+    # Remove old schema files in this directory. The directory also holds
+    # pydantic_models.py, so only the JSON files are deleted, with one log line.
+    removed: int = 0
+    with os.scandir(schema_path.parent) as entries:
+        for entry in entries:
+            if entry.name.endswith('.json') and entry.is_file(follow_symlinks=False):
+                os.unlink(entry.path)
+                removed += 1
+    if removed:
+        logger.debug(f"Removed {removed} old JSON files from {schema_path.parent}")
     
     # Save schema
-    with open(schema_path, 'w') as f:
-        json.dump(schema, f, indent=2, default=str)
+    write_json(schema_path, schema, default=str)
     
     logger.info(f"Generated unified schema: {schema_path}")
     
-    if '$defs' in schema:
+    defs_keys: Tuple[str, ...] = tuple(schema.get('$defs', ()))
+    if defs_keys:
         logger.info(f"Main model: {main_model_name}")
-        logger.info(f"Nested definitions: {len(schema['$defs'])} types")
-        defs_list: List[str] = list(schema['$defs'].keys())
-        types_summary: str = ', '.join(defs_list[:8])
-        if len(defs_list) > 8:
-            types_summary += f"... (+{len(defs_list) - 8} more)"
+        logger.info(f"Nested definitions: {len(defs_keys)} types")
+        types_summary: str = ', '.join(islice(defs_keys, TYPES_PREVIEW_LIMIT))
+        if len(defs_keys) > TYPES_PREVIEW_LIMIT:
+            types_summary += f"... (+{len(defs_keys) - TYPES_PREVIEW_LIMIT} more)"
         logger.info(f"Types: {types_summary}")
     
     # Create summary file in same directory
@@ -92,12 +102,11 @@ def generate_json_schema(
         "main_model": main_model_name,
         "total_models": len(pydantic_models),
         "schema_file": str(schema_path),
-        "nested_types": len(schema.get('$defs', {})),
-        "models": list(pydantic_models.keys())
+        "nested_types": len(defs_keys),
+        "models": tuple(pydantic_models)
     }
     
-    with open(summary_file, 'w') as f:
-        json.dump(summary, f, indent=2)
+    write_json(summary_file, summary)
     
     logger.info(f"Created summary: {summary_file}")
     
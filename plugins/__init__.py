@@ -4,15 +4,42 @@ Built-in output format plugins.
 Provides standard output formats including JSON Schema and Pydantic code.
 """
 import logging
-import json
 from pathlib import Path
-from typing import Dict, Type, Any
+from typing import Dict, List, Optional, Tuple, Type, Any
 
+from utils.conversion import (
+    GENERATED_MODULE_IMPORTS,
+    cached_json_schema,
+    order_models_by_dependency,
+    render_model_class,
+    render_model_rebuilds,
+    render_type_imports
+)
+from utils.caching import WeakClassCache
+from utils.files import atomic_write_bytes, atomic_write_text
 from utils.plugins import OutputPlugin
+from utils.serialization import dumps_json
 
 logger: logging.Logger = logging.getLogger(__name__)
 
 
+@WeakClassCache
+def _serialized_schemas(model: Type[Any]) -> Dict[Tuple[Optional[int], bool], bytes]:
+    """Per-model store of serialized schemas, keyed by (indent, ensure_ascii)."""
+    return {}
+
+
+def _serialized_schema(model: Type[Any], indent: Optional[int], ensure_ascii: bool) -> bytes:
+    """Serialize a model's JSON Schema once per (model, indent, ensure_ascii)."""
+    by_options: Dict[Tuple[Optional[int], bool], bytes] = _serialized_schemas(model)
+    key: Tuple[Optional[int], bool] = (indent, ensure_ascii)
+    if key not in by_options:
+        by_options[key] = dumps_json(
+            cached_json_schema(model), default=str, indent=indent, ensure_ascii=ensure_ascii
+        )
+    return by_options[key]
+
+
 class JSONSchemaPlugin(OutputPlugin):
     """
     JSON Schema output plugin.
@@ -47,18 +74,16 @@ class JSONSchemaPlugin(OutputPlugin):
             available = ', '.join(pydantic_models.keys())
             raise ValueError(f"Model '{main_model}' not found. Available: {available}")
         
-        model = pydantic_models[main_model]
-        schema = model.model_json_schema()
+        model: Any = pydantic_models[main_model]
         
         # Ensure output directory exists
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Write schema
+        # Write schema (serialized once per model and options, orjson when available)
         indent = options.get('indent', 2)
         ensure_ascii = options.get('ensure_ascii', False)
         
-        with open(output_path, 'w') as f:
-            json.dump(schema, f, indent=indent, ensure_ascii=ensure_ascii, default=str)
+        atomic_write_bytes(output_path, _serialized_schema(model, indent, bool(ensure_ascii)))
         
         logger.info(f"Generated JSON Schema: {output_path}")
         return output_path
@@ -96,30 +121,19 @@ class PydanticCodePlugin(OutputPlugin):
         # Ensure output directory exists
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_path, 'w') as f:
-            f.write('"""\nGenerated Pydantic Models\n\n')
-            f.write('Auto-generated - do not edit manually.\n"""\n\n')
-            f.write('from pydantic import BaseModel\n')
-            f.write('from typing import Optional, List\n')
-            f.write('from decimal import Decimal\n')
-            f.write('from datetime import datetime, date\n\n')
-            
-            for name, model in pydantic_models.items():
-                f.write(f"class {name}(BaseModel):\n")
-                if model.model_fields:
-                    for field_name, field_info in model.model_fields.items():
-                        field_type = str(field_info.annotation).replace('typing.', '')
-                        if field_info.is_required():
-                            f.write(f"    {field_name}: {field_type}\n")
-                        else:
-                            default = field_info.default
-                            if default is None:
-                                f.write(f"    {field_name}: {field_type} = None\n")
-                            else:
-                                f.write(f"    {field_name}: {field_type} = {repr(default)}\n")
-                else:
-                    f.write("    pass\n")
-                f.write("\n")
+        parts: List[str] = [
+            '"""\nGenerated Pydantic Models\n\n',
+            'Auto-generated - do not edit manually.\n"""\n\n',
+            GENERATED_MODULE_IMPORTS,
+            render_type_imports(pydantic_models),
+            '\n',
+        ]
+        ordered_names: List[str] = order_models_by_dependency(pydantic_models)
+        parts.extend(render_model_class(name, pydantic_models[name]) for name in ordered_names)
+        parts.append(render_model_rebuilds(ordered_names))
+        
+        # One atomic write, UTF-8 with '\n' line endings regardless of platform locale
+        atomic_write_text(output_path, ''.join(parts))
         
         logger.info(f"Generated Pydantic code: {output_path}")
         return output_path
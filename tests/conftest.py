@@ -6,24 +6,48 @@ including sample XSD/WSDL files, temporary directories, and mock objects.
 """
 import pytest
 from pathlib import Path
-import tempfile
-import shutil
-from typing import Generator
+from typing import Final
+
+
+# Sample schemas shipped beside this file, resolved once at import
+TESTS_DIR: Final[Path] = Path(__file__).resolve().parent
+SAMPLE_XSD_FILE: Final[Path] = TESTS_DIR / "sample.xsd"
+SAMPLE_WSDL_FILE: Final[Path] = TESTS_DIR / "sample.wsdl"
+
+# Minimal valid XSD shared by the simple_xsd_* fixtures
+SIMPLE_XSD: bytes = b'''<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema"
+           targetNamespace="http://example.com/test"
+           xmlns:tns="http://example.com/test"
+           elementFormDefault="qualified">
+    
+    <xs:complexType name="PersonType">
+        <xs:sequence>
+            <xs:element name="name" type="xs:string"/>
+            <xs:element name="age" type="xs:int"/>
+            <xs:element name="email" type="xs:string" minOccurs="0"/>
+        </xs:sequence>
+    </xs:complexType>
+    
+    <xs:element name="Person" type="tns:PersonType"/>
+</xs:schema>
+'''
 
 
 @pytest.fixture
-def temp_test_dir() -> Generator[Path, None, None]:
+def temp_test_dir(tmp_path: Path) -> Path:
     """
-    Create a temporary directory for test outputs.
+    Provide a temporary directory for test outputs.
+    
+    Uses pytest's per-test tmp_path, which pytest cleans up in bulk.
+    
+    Args:
+        tmp_path: Pytest per-test temporary directory
     
-    Yields:
+    Returns:
         Path to temporary directory
     """
-    temp_dir = Path(tempfile.mkdtemp(prefix="zeep_test_"))
-    yield temp_dir
-    # Cleanup
-    if temp_dir.exists():
-        shutil.rmtree(temp_dir, ignore_errors=True)
+    return tmp_path
 
 
 @pytest.fixture
@@ -34,7 +58,7 @@ def sample_xsd_file() -> Path:
     Returns:
         Path to the sample XSD file
     """
-    return Path(__file__).parent / "sample.xsd"
+    return SAMPLE_XSD_FILE
 
 
 @pytest.fixture
@@ -45,10 +69,10 @@ def sample_wsdl_file() -> Path:
     Returns:
         Path to the sample WSDL file
     """
-    return Path(__file__).parent / "sample.wsdl"
+    return SAMPLE_WSDL_FILE
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def simple_xsd_content() -> str:
     """
     Simple XSD content for basic testing.
@@ -56,52 +80,22 @@ def simple_xsd_content() -> str:
     Returns:
         String containing minimal valid XSD
     """
-    return '''<?xml version="1.0" encoding="UTF-8"?>
-<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema"
-           targetNamespace="http://example.com/test"
-           xmlns:tns="http://example.com/test"
-           elementFormDefault="qualified">
-    
-    <xs:complexType name="PersonType">
-        <xs:sequence>
-            <xs:element name="name" type="xs:string"/>
-            <xs:element name="age" type="xs:int"/>
-            <xs:element name="email" type="xs:string" minOccurs="0"/>
-        </xs:sequence>
-    </xs:complexType>
-    
-    <xs:element name="Person" type="tns:PersonType"/>
-</xs:schema>
-'''
+    return SIMPLE_XSD.decode('utf-8')
 
 
-@pytest.fixture
-def simple_xsd_file(temp_test_dir: Path) -> Path:
+@pytest.fixture(scope="session")
+def simple_xsd_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """
-    Create a simple XSD file for testing.
+    Create a simple XSD file for testing, once per session.
+    
+    Tests must not modify this file; copy it first if a test needs to.
     
     Args:
-        temp_test_dir: Temporary directory fixture
+        tmp_path_factory: Pytest session temporary directory factory
     
     Returns:
         Path to created XSD file
     """
-    xsd_file = temp_test_dir / "simple.xsd"
-    xsd_file.write_text('''<?xml version="1.0" encoding="UTF-8"?>
-<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema"
-           targetNamespace="http://example.com/test"
-           xmlns:tns="http://example.com/test"
-           elementFormDefault="qualified">
-    
-    <xs:complexType name="PersonType">
-        <xs:sequence>
-            <xs:element name="name" type="xs:string"/>
-            <xs:element name="age" type="xs:int"/>
-            <xs:element name="email" type="xs:string" minOccurs="0"/>
-        </xs:sequence>
-    </xs:complexType>
-    
-    <xs:element name="Person" type="tns:PersonType"/>
-</xs:schema>
-''')
+    xsd_file = tmp_path_factory.mktemp("xsd") / "simple.xsd"
+    xsd_file.write_bytes(SIMPLE_XSD)
     return xsd_file
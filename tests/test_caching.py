@@ -0,0 +1,61 @@
+"""
+Unit tests for per-class caching helpers.
+
+Tests that cached results are reused and that cached classes can be collected.
+"""
+import gc
+import pytest
+import weakref
+from dataclasses import dataclass
+from typing import Optional
+
+from plugins import _serialized_schema
+from utils.caching import WeakClassCache
+from utils.conversion import (
+    cached_json_schema,
+    dataclass_to_pydantic_model,
+    render_model_class
+)
+
+
+@pytest.mark.unit
+def test_weak_class_cache_reuses_results() -> None:
+    """Test that the wrapped function runs once per class."""
+    calls = []
+    
+    @WeakClassCache
+    def describe(cls: type) -> str:
+        calls.append(cls)
+        return cls.__name__
+    
+    class Sample:
+        pass
+    
+    assert describe(Sample) == describe(Sample) == 'Sample'
+    assert calls == [Sample]
+    
+    describe.cache_clear()
+    describe(Sample)
+    assert len(calls) == 2
+
+
+@pytest.mark.unit
+def test_conversion_caches_release_model_classes() -> None:
+    """Test that rendering and schema caches do not keep generated models alive."""
+    @dataclass
+    class Leaf:
+        name: str
+        note: Optional[str] = None
+    
+    model = dataclass_to_pydantic_model(Leaf)
+    cached_json_schema(model)
+    render_model_class('Leaf', model)
+    _serialized_schema(model, 2, False)
+    
+    model_ref = weakref.ref(model)
+    dataclass_ref = weakref.ref(Leaf)
+    del model, Leaf
+    gc.collect()
+    
+    assert model_ref() is None
+    assert dataclass_ref() is None
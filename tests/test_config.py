@@ -0,0 +1,87 @@
+"""
+Unit tests for configuration loading and discovery.
+
+Tests config file lookup order and parent-directory search.
+"""
+import os
+import pytest
+import yaml
+from pathlib import Path
+
+from utils.config import Config
+
+
+@pytest.mark.unit
+def test_discover_prefers_yaml_in_same_directory(temp_test_dir: Path) -> None:
+    """Test that .yaml wins over .yml and .toml in one directory."""
+    (temp_test_dir / '.zeep-codegen.toml').write_text('source = "toml"\n')
+    (temp_test_dir / '.zeep-codegen.yml').write_text('source: yml\n')
+    (temp_test_dir / '.zeep-codegen.yaml').write_text('source: yaml\n')
+    
+    config = Config.discover(temp_test_dir)
+    
+    assert config is not None
+    assert config.get('source') == 'yaml'
+
+
+@pytest.mark.unit
+def test_discover_searches_parent_directories(temp_test_dir: Path) -> None:
+    """Test that discovery walks up to find a config file."""
+    (temp_test_dir / '.zeep-codegen.toml').write_text('timeout = 5\n')
+    # A directory with a config name is not a config file
+    nested = temp_test_dir / 'a' / 'b'
+    (nested / '.zeep-codegen.yaml').mkdir(parents=True)
+    
+    config = Config.discover(nested)
+    
+    assert config is not None
+    assert config.get('timeout') == 5
+
+
+@pytest.mark.unit
+def test_load_from_file_caches_until_file_changes(temp_test_dir: Path) -> None:
+    """Test that an unchanged file is reused and an edited one is re-read."""
+    config_file = temp_test_dir / '.zeep-codegen.yaml'
+    config_file.write_text('output_dir: ./one\n')
+    
+    first = Config.load_from_file(config_file)
+    first.set('output_dir', './mutated')
+    second = Config.load_from_file(config_file)
+    
+    # Cached data is copied, so mutating one Config does not leak into another
+    assert second.get('output_dir') == './one'
+    
+    config_file.write_text('output_dir: ./changed\n')
+    assert Config.load_from_file(config_file).get('output_dir') == './changed'
+
+
+@pytest.mark.unit
+def test_load_from_file_parses_yaml_safely(temp_test_dir: Path) -> None:
+    """Test that YAML is parsed with a safe loader (no arbitrary Python objects)."""
+    config_file = temp_test_dir / '.zeep-codegen.yml'
+    config_file.write_text('keep_temp: true\nobj: !!python/object:object {}\n')
+    
+    with pytest.raises(yaml.constructor.ConstructorError):
+        Config.load_from_file(config_file)
+
+
+@pytest.mark.unit
+def test_load_from_file_cache_keyed_by_resolved_path(
+    temp_test_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that one relative path in two directories loads two different files."""
+    first_dir = temp_test_dir / 'first'
+    second_dir = temp_test_dir / 'second'
+    for directory, value in ((first_dir, 'one'), (second_dir, 'two')):
+        directory.mkdir()
+        config_file = directory / '.zeep-codegen.yaml'
+        config_file.write_text(f'output_dir: ./{value}\n')
+    # Same mtime and size, so only the path tells the files apart
+    stat_ns = (first_dir / '.zeep-codegen.yaml').stat().st_mtime_ns
+    os.utime(second_dir / '.zeep-codegen.yaml', ns=(stat_ns, stat_ns))
+    
+    relative = Path('.zeep-codegen.yaml')
+    monkeypatch.chdir(first_dir)
+    assert Config.load_from_file(relative).get('output_dir') == './one'
+    monkeypatch.chdir(second_dir)
+    assert Config.load_from_file(relative).get('output_dir') == './two'
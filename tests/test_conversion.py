@@ -5,21 +5,63 @@ Tests dataclass to Pydantic model conversion.
 """
 import pytest
 from dataclasses import dataclass, field
-from typing import Optional, List
+from decimal import Decimal
+from enum import Enum
+from functools import lru_cache
+from typing import ForwardRef, Optional, List, NoReturn
 
-from utils.conversion import dataclass_to_pydantic_model, inspect_dataclass_fields
+from utils.conversion import (
+    asdict_shallow,
+    cached_json_schema,
+    dataclass_to_pydantic_model,
+    inspect_dataclass_fields,
+    pydantic_instance_from_dataclass,
+    format_annotation,
+    format_field,
+    order_models_by_dependency,
+    render_model_class,
+    resolve_forward_refs,
+    _field_lines,
+    _field_table
+)
 from pydantic import BaseModel
 
 
+@dataclass
+class Person:
+    name: str
+    age: int
+    email: Optional[str] = None
+
+
+@dataclass
+class Config:
+    host: str = "localhost"
+    port: int = 8080
+    debug: bool = False
+
+
+@dataclass
+class Order:
+    order_id: str
+    items: List[str] = field(default_factory=list)
+
+
+@dataclass
+class Sample:
+    required: str
+    optional: Optional[int] = None
+    with_default: str = "default"
+
+
+# Build each shared model once for the whole module
+_to_model = lru_cache(maxsize=None)(dataclass_to_pydantic_model)
+
+
 @pytest.mark.unit
 def test_dataclass_to_pydantic_simple() -> None:
     """Test conversion of simple dataclass to Pydantic model."""
-    @dataclass
-    class Person:
-        name: str
-        age: int
-    
-    PersonModel = dataclass_to_pydantic_model(Person)
+    PersonModel = _to_model(Person)
     
     # Check model can be instantiated
     person = PersonModel(name="Alice", age=30)
@@ -33,13 +75,7 @@ def test_dataclass_to_pydantic_simple() -> None:
 @pytest.mark.unit
 def test_dataclass_to_pydantic_optional_fields() -> None:
     """Test conversion with optional fields."""
-    @dataclass
-    class Person:
-        name: str
-        age: int
-        email: Optional[str] = None
-    
-    PersonModel = dataclass_to_pydantic_model(Person)
+    PersonModel = _to_model(Person)
     
     # Should work without optional field
     person1 = PersonModel(name="Bob", age=25)
@@ -53,13 +89,7 @@ def test_dataclass_to_pydantic_optional_fields() -> None:
 @pytest.mark.unit
 def test_dataclass_to_pydantic_with_defaults() -> None:
     """Test conversion with default values."""
-    @dataclass
-    class Config:
-        host: str = "localhost"
-        port: int = 8080
-        debug: bool = False
-    
-    ConfigModel = dataclass_to_pydantic_model(Config)
+    ConfigModel = _to_model(Config)
     
     # Should use defaults
     config = ConfigModel()
@@ -71,18 +101,12 @@ def test_dataclass_to_pydantic_with_defaults() -> None:
 @pytest.mark.unit
 def test_dataclass_to_pydantic_with_list() -> None:
     """Test conversion with list fields."""
-    @dataclass
-    class Order:
-        order_id: str
-        items: List[str] = field(default_factory=list)
-    
-    OrderModel = dataclass_to_pydantic_model(Order)
+    OrderModel = _to_model(Order)
     
-    # Pydantic's create_model with default_factory=list stores the factory (class)
-    # not an instance. This is expected behavior for dynamic model creation.
+    # default_factory is passed through, so each instance gets a fresh list
     order = OrderModel(order_id="123")
-    # The factory is stored, so items will be the list class itself
-    assert order.items == list or order.items == []
+    assert order.items == []
+    assert OrderModel(order_id="124").items is not order.items
     
     order2 = OrderModel(order_id="456", items=["item1", "item2"])
     assert len(order2.items) == 2
@@ -91,12 +115,6 @@ def test_dataclass_to_pydantic_with_list() -> None:
 @pytest.mark.unit
 def test_inspect_dataclass_fields() -> None:
     """Test dataclass field inspection."""
-    @dataclass
-    class Sample:
-        required: str
-        optional: Optional[int] = None
-        with_default: str = "default"
-    
     fields = inspect_dataclass_fields(Sample)
     
     assert len(fields) == 3
@@ -108,6 +126,21 @@ def test_inspect_dataclass_fields() -> None:
     assert fields[2][2] == 'default'
 
 
+@pytest.mark.unit
+def test_field_table_is_cached_per_class() -> None:
+    """Test that the field table is built once and reused."""
+    @dataclass
+    class Single:
+        value: str
+    
+    assert _field_table(Single) is _field_table(Single)
+    
+    # Callers get a fresh list they are free to mutate
+    fields = inspect_dataclass_fields(Single)
+    fields.clear()
+    assert inspect_dataclass_fields(Single) == [('value', str, ...)]
+
+
 @pytest.mark.unit
 def test_dataclass_to_pydantic_not_dataclass() -> None:
     """Test error handling for non-dataclass input."""
@@ -121,9 +154,204 @@ def test_dataclass_to_pydantic_not_dataclass() -> None:
 @pytest.mark.unit
 def test_dataclass_to_pydantic_custom_model_name() -> None:
     """Test custom model name."""
+    PersonModel = dataclass_to_pydantic_model(Person, "CustomPerson")
+    assert PersonModel.__name__ == "CustomPerson"
+
+
+@pytest.mark.unit
+def test_format_annotation_emits_source() -> None:
+    """Test that annotations render as importable source, not reprs."""
+    @dataclass
+    class Address:
+        street: str
+    
+    AddressModel = dataclass_to_pydantic_model(Address)
+    
+    assert format_annotation(str) == 'str'
+    assert format_annotation(Decimal) == 'Decimal'
+    assert format_annotation(AddressModel) == 'Address'
+    assert format_annotation(Optional[AddressModel]) == 'Optional[Address]'
+    assert format_annotation(None | Decimal) == 'Optional[Decimal]'
+    assert format_annotation(List[AddressModel]) == 'list[Address]'  # type: ignore[valid-type]
+    assert format_annotation(int | str) == 'int | str'
+    assert format_annotation(NoReturn) == 'NoReturn'
+
+
+@pytest.mark.unit
+def test_format_field_defaults() -> None:
+    """Test rendering of field defaults, factories and enum members."""
+    class Status(Enum):
+        PENDING = "pending"
+    
     @dataclass
-    class Person:
+    class Record:
         name: str
+        tags: List[str] = field(default_factory=list)
+        status: Status = Status.PENDING
+        note: Optional[str] = None
     
-    PersonModel = dataclass_to_pydantic_model(Person, "CustomPerson")
-    assert PersonModel.__name__ == "CustomPerson"
+    RecordModel = dataclass_to_pydantic_model(Record)
+    lines = [format_field(n, f) for n, f in RecordModel.model_fields.items()]
+    
+    assert lines == [
+        "    name: str",
+        "    tags: list[str] = Field(default_factory=list)",
+        "    status: Status = Status.PENDING",
+        "    note: Optional[str] = None",
+    ]
+
+
+@pytest.mark.unit
+def test_order_models_by_dependency() -> None:
+    """Test that referenced models are ordered before their users."""
+    @dataclass
+    class Leaf:
+        value: str
+    
+    LeafModel = dataclass_to_pydantic_model(Leaf)
+    
+    @dataclass
+    class Branch:
+        leaves: List[LeafModel]  # type: ignore[valid-type]
+    
+    BranchModel = dataclass_to_pydantic_model(Branch)
+    
+    order = order_models_by_dependency({'Branch': BranchModel, 'Leaf': LeafModel})
+    assert order.index('Leaf') < order.index('Branch')
+
+
+@pytest.mark.unit
+def test_pydantic_instance_from_dataclass() -> None:
+    """Test trusted conversion of nested dataclass instances."""
+    @dataclass
+    class Item:
+        sku: str
+    
+    @dataclass
+    class Basket:
+        owner: str
+        items: List[Item] = field(default_factory=list)
+    
+    models = {
+        'Item': dataclass_to_pydantic_model(Item),
+        'Basket': dataclass_to_pydantic_model(Basket),
+    }
+    
+    basket = pydantic_instance_from_dataclass(
+        Basket(owner="Dana", items=[Item(sku="A1")]), models
+    )
+    
+    assert isinstance(basket, models['Basket'])
+    assert isinstance(basket.items[0], models['Item'])
+    assert basket.model_dump() == {'owner': 'Dana', 'items': [{'sku': 'A1'}]}
+    
+    with pytest.raises(ValueError, match="not a dataclass instance"):
+        pydantic_instance_from_dataclass(Basket, models)
+
+
+@pytest.mark.unit
+def test_asdict_shallow_keeps_nested_objects() -> None:
+    """Test that asdict_shallow does not recurse into or copy nested values."""
+    @dataclass
+    class Inner:
+        value: int
+    
+    @dataclass
+    class Outer:
+        inner: Inner
+        tags: List[str] = field(default_factory=list)
+    
+    outer = Outer(inner=Inner(value=1), tags=["a"])
+    result = asdict_shallow(outer)
+    
+    assert list(result) == ['inner', 'tags']
+    assert result['inner'] is outer.inner
+    assert result['tags'] is outer.tags
+    
+    with pytest.raises(ValueError, match="not a dataclass instance"):
+        asdict_shallow(Outer)
+
+
+@pytest.mark.unit
+def test_dataclass_to_pydantic_model_config() -> None:
+    """Test that generated models are strict, frozen and read attributes."""
+    from pydantic import ValidationError
+    
+    @dataclass
+    class Point:
+        x: int
+        y: int
+    
+    PointModel = dataclass_to_pydantic_model(Point)
+    
+    point = PointModel.model_validate(Point(x=1, y=2))
+    assert (point.x, point.y) == (1, 2)
+    
+    with pytest.raises(ValidationError):
+        PointModel(x=1, y=2, z=3)
+    with pytest.raises(ValidationError):
+        point.x = 5
+
+
+@pytest.mark.unit
+def test_render_model_class() -> None:
+    """Test that a model renders as a complete class definition."""
+    @dataclass
+    class Item:
+        sku: str
+        qty: int = 1
+    
+    source = render_model_class('Item', dataclass_to_pydantic_model(Item))
+    
+    assert source.startswith("class Item(BaseModel):\n    model_config = ConfigDict(")
+    assert "\n\n    sku: str\n    qty: int = 1\n" in source
+    assert source.endswith("\n\n")
+    
+    # Field lines are snapshotted once per model class
+    model = _to_model(Order)
+    assert _field_lines(model) is _field_lines(model)
+    assert render_model_class('Order', model) == render_model_class('Order', model)
+
+
+@pytest.mark.unit
+def test_cached_json_schema_generates_once() -> None:
+    """Test that JSON Schema generation runs once per model class."""
+    from unittest.mock import patch
+    
+    class Widget(BaseModel):
+        name: str
+    
+    with patch.object(Widget, 'model_json_schema', wraps=Widget.model_json_schema) as mock_schema:
+        first = cached_json_schema(Widget)
+        second = cached_json_schema(Widget)
+    
+    assert first is second
+    assert first['properties']['name']['type'] == 'string'
+    mock_schema.assert_called_once()
+
+
+@pytest.mark.unit
+def test_resolve_forward_refs_exposes_dependencies() -> None:
+    """Test that resolved string references let models be ordered dependencies first."""
+    @dataclass
+    class Branch:
+        leaf: "None | Leaf" = None
+        missing: "None | Unknown" = None  # type: ignore[name-defined]  # noqa: F821
+    
+    @dataclass
+    class Leaf:
+        name: str
+    
+    models = {
+        'Branch': dataclass_to_pydantic_model(Branch),
+        'Leaf': dataclass_to_pydantic_model(Leaf),
+    }
+    namespace = dict(models)
+    
+    resolve_forward_refs(models['Branch'], namespace)
+    
+    branch_fields = models['Branch'].model_fields
+    assert branch_fields['leaf'].annotation == Optional[models['Leaf']]
+    # Unresolvable names are left for model_rebuild() to report
+    assert isinstance(branch_fields['missing'].annotation, ForwardRef)
+    assert order_models_by_dependency(models) == ['Leaf', 'Branch']
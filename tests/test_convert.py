@@ -0,0 +1,243 @@
+"""
+Unit tests for the convert module.
+
+Tests convert_to_pydantic against small hand-written dataclass modules.
+"""
+import importlib.util
+import pydantic
+import pytest
+import sys
+from pathlib import Path
+from types import ModuleType
+
+from pipeline.convert import convert_to_pydantic
+from utils.temp_manager import preserve_sys_path
+
+
+PRICED_MODULE = '''from __future__ import annotations
+
+from dataclasses import dataclass
+from decimal import Decimal
+
+
+@dataclass(kw_only=True)
+class PricedItemType:
+    name: str
+    price: Decimal
+    discount: None | Decimal = None
+'''
+
+
+def _write_module(temp_dir: Path, package: str, source: str) -> str:
+    """Write a single-module package and return its dotted module name."""
+    package_dir = temp_dir / package
+    package_dir.mkdir()
+    (package_dir / "__init__.py").write_text("")
+    (package_dir / "models.py").write_text(source)
+    return f"{package}.models"
+
+
+def _import_generated(
+    models_file: Path, temp_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> ModuleType:
+    """Import an emitted models file, with temp_dir importable for its source module."""
+    module_name = f"emitted_{models_file.parent.name}"
+    spec = importlib.util.spec_from_file_location(module_name, models_file)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, module_name, module)
+    with preserve_sys_path():
+        sys.path.insert(0, str(temp_dir))
+        spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.unit
+def test_convert_to_pydantic_keeps_decimal_by_default(temp_test_dir: Path) -> None:
+    """Test that xs:decimal fields stay Decimal unless asked otherwise."""
+    from decimal import Decimal
+    
+    module_name = _write_module(temp_test_dir, "priced_default", PRICED_MODULE)
+    models, _ = convert_to_pydantic(module_name, temp_test_dir, temp_test_dir / "out")
+    
+    assert models['PricedItemType'].model_fields['price'].annotation is Decimal
+
+
+@pytest.mark.unit
+def test_convert_to_pydantic_decimal_as_float(temp_test_dir: Path) -> None:
+    """Test that decimal_as_float maps Decimal fields to float."""
+    module_name = _write_module(temp_test_dir, "priced_float", PRICED_MODULE)
+    models, models_file = convert_to_pydantic(
+        module_name, temp_test_dir, temp_test_dir / "out", decimal_as_float=True
+    )
+    
+    model = models['PricedItemType']
+    assert model.model_fields['price'].annotation is float
+    assert model.model_json_schema()['properties']['price'] == {
+        'title': 'Price', 'type': 'number'
+    }
+    assert "    price: float" in models_file.read_text()
+
+
+WRAPPER_MODULE = '''from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(kw_only=True)
+class NoteType:
+    text: str
+
+
+@dataclass(kw_only=True)
+class Note(NoteType):
+    class Meta:
+        namespace = "http://example.com/test"
+'''
+
+
+@pytest.mark.unit
+def test_convert_to_pydantic_aliases_wrapper_subclass(temp_test_dir: Path) -> None:
+    """Test that a field-less element wrapper is written as an alias."""
+    module_name = _write_module(temp_test_dir, "wrapper_alias", WRAPPER_MODULE)
+    models, models_file = convert_to_pydantic(module_name, temp_test_dir, temp_test_dir / "out")
+    
+    source = models_file.read_text()
+    assert "class NoteType(BaseModel):" in source
+    assert "class Note(BaseModel):" not in source
+    assert "Note = NoteType" in source
+    
+    # Runtime models stay distinct so schema titles are unchanged
+    assert models['Note'].model_json_schema()['title'] == 'Note'
+
+
+MESSAGE_MODULE = '''from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(kw_only=True)
+class PingRequestType:
+    message: str
+    count: int = 1
+
+
+@dataclass(kw_only=True)
+class PingRequest:
+    message: str
+    count: int = 1
+
+
+@dataclass(kw_only=True)
+class PingReply:
+    message: str
+'''
+
+
+@pytest.mark.unit
+def test_convert_to_pydantic_aliases_identical_type_pair(temp_test_dir: Path) -> None:
+    """Test that X and XType with identical fields are emitted once."""
+    module_name = _write_module(temp_test_dir, "message_alias", MESSAGE_MODULE)
+    _, models_file = convert_to_pydantic(module_name, temp_test_dir, temp_test_dir / "out")
+    
+    source = models_file.read_text()
+    assert "class PingRequestType(BaseModel):" in source
+    assert "PingRequest = PingRequestType" in source
+    assert "class PingReply(BaseModel):" in source
+
+
+@pytest.mark.unit
+def test_convert_to_pydantic_resolves_forward_references(temp_test_dir: Path) -> None:
+    """Test that nested and recursive forward references resolve to models."""
+    source = '''from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+
+@dataclass(kw_only=True)
+class FolderType:
+    name: str
+    parent: None | FolderType = None
+    files: list[FileType] = field(default_factory=list)
+
+
+@dataclass(kw_only=True)
+class FileType:
+    name: str
+'''
+    module_name = _write_module(temp_test_dir, "folders", source)
+    models, _ = convert_to_pydantic(module_name, temp_test_dir, temp_test_dir / "out")
+    
+    folder_model = models['FolderType']
+    assert all(model.__pydantic_complete__ for model in models.values())
+    
+    folder = folder_model.model_validate(
+        {'name': 'b', 'parent': {'name': 'a'}, 'files': [{'name': 'f.txt'}]}
+    )
+    assert isinstance(folder.parent, folder_model)
+    assert isinstance(folder.files[0], models['FileType'])
+
+
+RECURSIVE_MODULE = '''from __future__ import annotations
+
+from dataclasses import dataclass, field
+from enum import Enum
+
+from xsdata.models.datatype import XmlDate
+
+
+class StatusType(Enum):
+    OPEN = "open"
+    CLOSED = "closed"
+
+
+class Field(Enum):
+    """Unreferenced schema type whose name would shadow pydantic.Field."""
+    NAME = "name"
+
+
+@dataclass(kw_only=True)
+class FolderType:
+    name: str
+    created: None | XmlDate = None
+    status: StatusType = StatusType.OPEN
+    parent: None | FolderType = None
+    children: list[FolderType] = field(default_factory=list)
+    owner: None | UserType = None
+
+
+@dataclass(kw_only=True)
+class UserType:
+    home: None | FolderType = None
+'''
+
+
+@pytest.mark.unit
+def test_convert_to_pydantic_emits_importable_recursive_models(
+    temp_test_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that emitted self-referential and cyclic models import and bind to each other."""
+    module_name = _write_module(temp_test_dir, "recursive", RECURSIVE_MODULE)
+    _, models_file = convert_to_pydantic(module_name, temp_test_dir, temp_test_dir / "out")
+    
+    source = models_file.read_text()
+    assert "import *" not in source
+    assert f"import {module_name} as _source" in source
+    
+    emitted = _import_generated(models_file, temp_test_dir, monkeypatch)
+    folder_type = emitted.FolderType
+    assert folder_type.__pydantic_complete__
+    
+    folder = folder_type.model_validate({
+        'name': 'b',
+        'parent': {'name': 'a'},
+        'children': [{'name': 'c'}],
+        'owner': {'home': {'name': 'home'}},
+    })
+    assert isinstance(folder.parent, folder_type)
+    assert isinstance(folder.children[0], folder_type)
+    assert isinstance(folder.owner, emitted.UserType)
+    assert isinstance(folder.owner.home, folder_type)
+    assert folder.status is emitted.StatusType.OPEN
+    # The schema's own Field enum does not shadow pydantic.Field
+    assert emitted.Field is pydantic.Field
@@ -3,12 +3,17 @@ Unit tests for the download module.
 
 Tests the download_from_url function with mocked HTTP requests.
 """
+import io
 import pytest
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
 from pathlib import Path
+from typing import Any, Dict, Optional
 from unittest.mock import Mock, patch
 import requests
+from requests.adapters import HTTPAdapter
 
-from pipeline.download import download_from_url
+from pipeline.download import download_from_url, download_many_urls
 from exceptions import DownloadError
 
 
@@ -17,10 +22,10 @@ def test_download_from_url_success(temp_test_dir: Path) -> None:
     """Test successful download from URL."""
     mock_response = Mock()
     mock_response.status_code = 200
-    mock_response.content = b'<xml>test</xml>'
+    mock_response.raw = io.BytesIO(b'<xml>test</xml>')
     mock_response.headers = {'content-type': 'application/xml'}
     
-    with patch('requests.get', return_value=mock_response):
+    with patch('pipeline.download._SESSION.get', return_value=mock_response):
         with patch('pipeline.download.Path', return_value=temp_test_dir):
             result = download_from_url('https://example.com/test.wsdl')
             
@@ -31,7 +36,7 @@ def test_download_from_url_success(temp_test_dir: Path) -> None:
 @pytest.mark.unit
 def test_download_from_url_timeout() -> None:
     """Test download timeout handling."""
-    with patch('requests.get', side_effect=requests.exceptions.Timeout):
+    with patch('pipeline.download._SESSION.get', side_effect=requests.exceptions.Timeout):
         with pytest.raises(DownloadError, match="timed out"):
             download_from_url('https://example.com/test.wsdl', timeout=5)
 
@@ -39,7 +44,7 @@ def test_download_from_url_timeout() -> None:
 @pytest.mark.unit
 def test_download_from_url_connection_error() -> None:
     """Test connection error handling."""
-    with patch('requests.get', side_effect=requests.exceptions.ConnectionError):
+    with patch('pipeline.download._SESSION.get', side_effect=requests.exceptions.ConnectionError):
         with pytest.raises(DownloadError, match="Could not connect"):
             download_from_url('https://example.com/test.wsdl')
 
@@ -52,7 +57,7 @@ def test_download_from_url_http_error() -> None:
     mock_response.reason = 'Not Found'
     mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError(response=mock_response)
     
-    with patch('requests.get', return_value=mock_response):
+    with patch('pipeline.download._SESSION.get', return_value=mock_response):
         with pytest.raises(DownloadError, match="HTTP 404"):
             download_from_url('https://example.com/test.wsdl')
 
@@ -62,10 +67,10 @@ def test_download_from_url_filename_detection() -> None:
     """Test filename detection from URL."""
     mock_response = Mock()
     mock_response.status_code = 200
-    mock_response.content = b'<xml>test</xml>'
+    mock_response.raw = io.BytesIO(b'<xml>test</xml>')
     mock_response.headers = {'content-type': 'application/xml'}
     
-    with patch('requests.get', return_value=mock_response):
+    with patch('pipeline.download._SESSION.get', return_value=mock_response):
         result = download_from_url('https://example.com/myservice.wsdl')
         
         assert result.name == 'myservice.wsdl'
@@ -76,11 +81,165 @@ def test_download_from_url_generic_filename() -> None:
     """Test generic filename when no extension in URL."""
     mock_response = Mock()
     mock_response.status_code = 200
-    mock_response.content = b'<xml>test</xml>'
+    mock_response.raw = io.BytesIO(b'<xml>test</xml>')
     mock_response.headers = {'content-type': 'application/xml'}
     
-    with patch('requests.get', return_value=mock_response):
+    with patch('pipeline.download._SESSION.get', return_value=mock_response):
         result = download_from_url('https://example.com/service?wsdl')
         
         # Should use generic name for WSDL
         assert 'downloaded' in result.name
+
+
+@pytest.mark.unit
+def test_download_session_reuses_connections() -> None:
+    """Test that downloads share one pooled session with retries."""
+    from pipeline.download import _SESSION, USER_AGENT
+    
+    adapter = _SESSION.get_adapter('https://example.com/test.wsdl')
+    
+    assert isinstance(adapter, HTTPAdapter)
+    assert _SESSION.headers['User-Agent'] == USER_AGENT
+    assert adapter.max_retries.total == 3
+    assert adapter.max_retries.status_forcelist is not None
+    assert 503 in adapter.max_retries.status_forcelist
+    # Exhausted status retries return the response instead of raising RetryError
+    assert adapter.max_retries.raise_on_status is False
+
+
+@pytest.mark.unit
+def test_download_from_url_reports_status_after_retries(temp_test_dir: Path) -> None:
+    """Test that a persistent 503 is reported as an HTTP error once retries run out."""
+    from pipeline.download import _SESSION
+    
+    class UnavailableHandler(BaseHTTPRequestHandler):
+        requests_seen = 0
+        
+        def do_GET(self) -> None:
+            UnavailableHandler.requests_seen += 1
+            self.send_response(503, 'Service Unavailable')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+        
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+    
+    server = HTTPServer(('127.0.0.1', 0), UnavailableHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    adapter = _SESSION.get_adapter('http://127.0.0.1/')
+    assert isinstance(adapter, HTTPAdapter)
+    try:
+        with patch.object(adapter.max_retries, 'backoff_factor', 0):
+            with patch('pipeline.download.TEMP_DIR', str(temp_test_dir)):
+                with pytest.raises(DownloadError, match="HTTP 503 - Service Unavailable"):
+                    download_from_url(f'http://127.0.0.1:{server.server_port}/test.wsdl')
+    finally:
+        server.shutdown()
+        server.server_close()
+    
+    assert UnavailableHandler.requests_seen == 4
+
+
+@pytest.mark.unit
+def test_download_from_url_streams_body(temp_test_dir: Path) -> None:
+    """Test that the body is streamed to disk and the response closed."""
+    mock_response = Mock()
+    mock_response.raw = io.BytesIO(b'<xml>test</xml>')
+    mock_response.headers = {'content-type': 'application/xml'}
+    
+    with patch('pipeline.download._SESSION.get', return_value=mock_response) as mock_get:
+        with patch('pipeline.download.TEMP_DIR', str(temp_test_dir)):
+            result = download_from_url('https://example.com/streamed.xsd')
+    
+    assert result.read_bytes() == b'<xml>test</xml>'
+    assert mock_get.call_args.kwargs['stream'] is True
+    assert mock_response.raw.decode_content is True
+    mock_response.close.assert_called_once()
+
+
+@pytest.mark.unit
+def test_download_many_urls(temp_test_dir: Path) -> None:
+    """Test that every distinct URL is downloaded once."""
+    urls = [
+        'https://example.com/service.wsdl',
+        'https://example.com/types.xsd',
+        'https://example.com/types.xsd',
+    ]
+    
+    def fake_download(url: str, timeout: int, name_tag: Optional[str] = None) -> Path:
+        return temp_test_dir / url.rsplit('/', 1)[-1]
+    
+    with patch('pipeline.download.download_from_url', side_effect=fake_download) as mock_download:
+        result = download_many_urls(urls)
+    
+    assert mock_download.call_count == 2
+    assert result == {
+        'https://example.com/service.wsdl': temp_test_dir / 'service.wsdl',
+        'https://example.com/types.xsd': temp_test_dir / 'types.xsd',
+    }
+
+
+@pytest.mark.unit
+def test_download_many_urls_keeps_colliding_names_apart(temp_test_dir: Path) -> None:
+    """Test that URLs sharing a filename are saved to separate files."""
+    bodies: Dict[str, bytes] = {
+        'https://example.com/a/types.xsd': b'<a/>',
+        'https://example.com/b/types.xsd': b'<b/>',
+        'https://example.com/OrderService?xsd=1': b'<xsd1/>',
+        'https://example.com/OrderService?xsd=2': b'<xsd2/>',
+        'https://example.com/service.wsdl': b'<wsdl/>',
+    }
+    
+    def fake_get(url: str, **kwargs: object) -> Mock:
+        response = Mock()
+        response.raw = io.BytesIO(bodies[url])
+        response.headers = {'content-type': 'application/xml'}
+        return response
+    
+    with patch('pipeline.download._SESSION.get', side_effect=fake_get):
+        with patch('pipeline.download.TEMP_DIR', str(temp_test_dir)):
+            result = download_many_urls(list(bodies))
+    
+    assert len(set(result.values())) == len(bodies)
+    for url, body in bodies.items():
+        assert result[url].read_bytes() == body
+    # A filename no other URL uses is kept as is
+    assert result['https://example.com/service.wsdl'].name == 'service.wsdl'
+    assert result['https://example.com/a/types.xsd'].name.startswith('types-')
+
+
+@pytest.mark.unit
+def test_download_many_urls_reports_failures(temp_test_dir: Path) -> None:
+    """Test that failures are collected after all downloads are attempted."""
+    def fake_download(url: str, timeout: int, name_tag: Optional[str] = None) -> Path:
+        if url.endswith('missing.xsd'):
+            raise DownloadError("HTTP 404 - Not Found")
+        return temp_test_dir / 'ok.xsd'
+    
+    with patch('pipeline.download.download_from_url', side_effect=fake_download) as mock_download:
+        with pytest.raises(DownloadError, match="1 of 2 files.*missing.xsd: HTTP 404"):
+            download_many_urls(['https://example.com/ok.xsd', 'https://example.com/missing.xsd'])
+    
+    assert mock_download.call_count == 2
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("url, content_type, expected", [
+    ('https://example.com/service?wsdl', 'text/html', 'downloaded.wsdl'),
+    ('https://example.com/schema', 'application/xml', 'downloaded.xsd'),
+    ('https://example.com/schema', 'text/plain', 'downloaded.xml'),
+])
+def test_download_from_url_generic_filename_by_type(
+    url: str, content_type: str, expected: str, temp_test_dir: Path
+) -> None:
+    """Test generic filenames chosen from the URL and content type."""
+    mock_response = Mock()
+    mock_response.raw = io.BytesIO(b'<xml>test</xml>')
+    mock_response.headers = {'content-type': content_type}
+    
+    with patch('pipeline.download._SESSION.get', return_value=mock_response):
+        with patch('pipeline.download.TEMP_DIR', str(temp_test_dir)):
+            result = download_from_url(url)
+    
+    assert result.name == expected
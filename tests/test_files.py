@@ -0,0 +1,36 @@
+"""
+Unit tests for the file writing utilities.
+
+Tests that atomic writes replace files only on success.
+"""
+import pytest
+from pathlib import Path
+
+from utils.files import atomic_open, atomic_write_text
+
+
+@pytest.mark.unit
+def test_atomic_write_text_replaces_file(temp_test_dir: Path) -> None:
+    """Test that the destination is replaced and no temp files remain."""
+    path = temp_test_dir / "models.py"
+    path.write_text("old\n")
+    
+    atomic_write_text(path, "new\n")
+    
+    assert path.read_bytes() == b"new\n"
+    assert [p.name for p in temp_test_dir.iterdir()] == ["models.py"]
+
+
+@pytest.mark.unit
+def test_atomic_open_keeps_original_on_error(temp_test_dir: Path) -> None:
+    """Test that a failed write leaves the previous file untouched."""
+    path = temp_test_dir / "service.wsdl"
+    path.write_bytes(b"<complete/>")
+    
+    with pytest.raises(RuntimeError):
+        with atomic_open(path) as f:
+            f.write(b"<trunc")
+            raise RuntimeError("connection dropped")
+    
+    assert path.read_bytes() == b"<complete/>"
+    assert [p.name for p in temp_test_dir.iterdir()] == ["service.wsdl"]
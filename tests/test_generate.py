@@ -3,84 +3,222 @@ Unit tests for the generate module.
 
 Tests the generate_dataclasses function with mocked subprocess calls.
 """
+import os
 import pytest
 from pathlib import Path
+from typing import Any, Generator
 from unittest.mock import Mock, patch
-import subprocess
 
 from pipeline.generate import generate_dataclasses
 from exceptions import XSDGenerationError
 
 
+@pytest.fixture(scope='module')
+def _patched_run() -> Generator[Mock, None, None]:
+    """
+    Patch subprocess.run once for the whole module.
+    
+    Scoped to this module rather than the session so that integration tests
+    still run the real xsdata CLI.
+    
+    Yields:
+        The patched subprocess.run mock
+    """
+    with patch('subprocess.run') as mocked:
+        yield mocked
+
+
+@pytest.fixture(autouse=True)
+def mock_run(_patched_run: Mock) -> Mock:
+    """
+    Reset the module-wide subprocess.run mock to a successful xsdata result.
+    
+    Tests adjust mock_run.return_value or mock_run.side_effect as needed.
+    
+    Returns:
+        The patched subprocess.run mock
+    """
+    _patched_run.reset_mock(return_value=True, side_effect=True)
+    _patched_run.return_value = Mock(returncode=0, stderr=b'')
+    return _patched_run
+
+
+def _fake_xsdata(cmd: Any, **kwargs: Any) -> Mock:
+    """Stand in for xsdata by writing a generated module into cwd."""
+    package_dir = Path(kwargs['cwd']) / 'generated_dataclasses'
+    package_dir.mkdir(parents=True)
+    (package_dir / 'simple.py').write_text('# generated\n')
+    return Mock(returncode=0, stderr=b'')
+
+
 @pytest.mark.unit
 def test_generate_dataclasses_success(simple_xsd_file: Path, temp_test_dir: Path) -> None:
     """Test successful dataclass generation."""
-    mock_result = Mock()
-    mock_result.returncode = 0
-    mock_result.stderr = ''
+    module_name, temp_path = generate_dataclasses(
+        str(simple_xsd_file),
+        temp_dir=temp_test_dir,
+        keep_temp=True
+    )
     
-    with patch('subprocess.run', return_value=mock_result):
-        module_name, temp_path = generate_dataclasses(
-            str(simple_xsd_file),
-            temp_dir=temp_test_dir,
-            keep_temp=True
-        )
-        
-        assert module_name == 'generated_dataclasses.simple'
-        assert temp_path == temp_test_dir
+    assert module_name == 'generated_dataclasses.simple'
+    assert temp_path == temp_test_dir
 
 
 @pytest.mark.unit
-def test_generate_dataclasses_xsdata_error(simple_xsd_file: Path, temp_test_dir: Path) -> None:
+def test_generate_dataclasses_xsdata_error(
+    simple_xsd_file: Path, temp_test_dir: Path, mock_run: Mock
+) -> None:
     """Test handling of xsdata generation errors."""
-    mock_result = Mock()
-    mock_result.returncode = 1
-    mock_result.stderr = 'xsdata error: invalid schema'
+    mock_run.return_value = Mock(returncode=1, stderr=b'xsdata error: invalid schema')
     
-    with patch('subprocess.run', return_value=mock_result):
-        with pytest.raises(XSDGenerationError, match="xsdata generation failed"):
-            generate_dataclasses(
-                str(simple_xsd_file),
-                temp_dir=temp_test_dir
-            )
+    with pytest.raises(XSDGenerationError, match="xsdata generation failed"):
+        generate_dataclasses(
+            str(simple_xsd_file),
+            temp_dir=temp_test_dir
+        )
 
 
 @pytest.mark.unit
 def test_generate_dataclasses_module_name_normalization() -> None:
     """Test that module names are properly normalized."""
-    mock_result = Mock()
-    mock_result.returncode = 0
-    mock_result.stderr = ''
-    
-    with patch('subprocess.run', return_value=mock_result):
-        with patch('pathlib.Path.mkdir'):
-            # Test with dashes in filename
-            module_name, _ = generate_dataclasses(
-                'my-service-v2.xsd',
-                keep_temp=True
-            )
-            assert module_name == 'generated_dataclasses.my_service_v2'
-            
-            # Test with dots in filename
-            module_name, _ = generate_dataclasses(
-                'service.1.0.xsd',
-                keep_temp=True
-            )
-            assert module_name == 'generated_dataclasses.service_1_0'
+    with patch('pathlib.Path.mkdir'):
+        # Test with dashes in filename
+        module_name, _ = generate_dataclasses(
+            'my-service-v2.xsd',
+            keep_temp=True
+        )
+        assert module_name == 'generated_dataclasses.my_service_v2'
+    
+        # Test with dots in filename
+        module_name, _ = generate_dataclasses(
+            'service.1.0.xsd',
+            keep_temp=True
+        )
+        assert module_name == 'generated_dataclasses.service_1_0'
 
 
 @pytest.mark.unit
 def test_generate_dataclasses_temp_dir_creation(simple_xsd_file: Path) -> None:
     """Test that temp directory is created if not provided."""
-    mock_result = Mock()
-    mock_result.returncode = 0
-    mock_result.stderr = ''
+    module_name, temp_path = generate_dataclasses(
+        str(simple_xsd_file),
+        keep_temp=True
+    )
     
-    with patch('subprocess.run', return_value=mock_result):
-        module_name, temp_path = generate_dataclasses(
-            str(simple_xsd_file),
-            keep_temp=True
-        )
-        
-        # Should use default .temp directory
-        assert temp_path == Path('.temp')
+    # Should use default .temp directory
+    assert temp_path == Path('.temp')
+
+
+@pytest.mark.unit
+def test_generate_dataclasses_requests_slots(
+    simple_xsd_file: Path, temp_test_dir: Path, mock_run: Mock
+) -> None:
+    """Test that xsdata is asked to emit slotted dataclasses."""
+    generate_dataclasses(
+        str(simple_xsd_file),
+        temp_dir=temp_test_dir,
+        keep_temp=True
+    )
+    
+    cmd = mock_run.call_args[0][0]
+    assert '--slots' in cmd
+    assert cmd[-1] == str(simple_xsd_file.absolute())
+
+
+@pytest.mark.unit
+def test_generate_dataclasses_reuses_cache(
+    simple_xsd_file: Path, temp_test_dir: Path, mock_run: Mock
+) -> None:
+    """Test that unchanged schemas are served from the cache without running xsdata."""
+    mock_run.side_effect = _fake_xsdata
+    cache_dir = temp_test_dir / "cache"
+    work_dir = temp_test_dir / "work"
+    xsd_file = temp_test_dir / "simple.xsd"
+    xsd_file.write_bytes(simple_xsd_file.read_bytes())
+    
+    first, _ = generate_dataclasses(
+        str(xsd_file), temp_dir=work_dir, keep_temp=True, cache_dir=cache_dir
+    )
+    # A fresh temp dir, as the CLI uses on every run
+    second, _ = generate_dataclasses(
+        str(xsd_file), temp_dir=temp_test_dir / "work2", keep_temp=True, cache_dir=cache_dir
+    )
+    
+    assert mock_run.call_count == 1
+    assert first == second == 'generated_dataclasses.simple'
+    assert (temp_test_dir / "work2" / 'generated_dataclasses' / 'simple.py').read_text() == '# generated\n'
+    
+    # Changing the schema invalidates the entry
+    xsd_file.write_text(xsd_file.read_text() + '\n')
+    generate_dataclasses(
+        str(xsd_file), temp_dir=work_dir, keep_temp=True, cache_dir=cache_dir
+    )
+    assert mock_run.call_count == 2
+
+
+@pytest.mark.unit
+def test_generate_dataclasses_skips_up_to_date_output(
+    simple_xsd_file: Path, temp_test_dir: Path, mock_run: Mock
+) -> None:
+    """Test that xsdata is skipped when the generated module is newer than the schema."""
+    mock_run.side_effect = _fake_xsdata
+    work_dir = temp_test_dir / "work"
+    
+    generate_dataclasses(str(simple_xsd_file), temp_dir=work_dir, keep_temp=True)
+    module_name, _ = generate_dataclasses(str(simple_xsd_file), temp_dir=work_dir, keep_temp=True)
+    
+    assert mock_run.call_count == 1
+    assert module_name == 'generated_dataclasses.simple'
+    
+    generate_dataclasses(
+        str(simple_xsd_file), temp_dir=work_dir, keep_temp=True, force_regenerate=True
+    )
+    assert mock_run.call_count == 2
+    
+    # A schema edited after generation makes the output stale; backdate against
+    # the shared session XSD, which may have been written long before this test
+    generated = work_dir / 'generated_dataclasses' / 'simple.py'
+    stale_ns = simple_xsd_file.stat().st_mtime_ns - 1_000_000_000
+    os.utime(generated, ns=(stale_ns, stale_ns))
+    generate_dataclasses(str(simple_xsd_file), temp_dir=work_dir, keep_temp=True)
+    assert mock_run.call_count == 3
+    
+    # Output from different xsdata options is not reused
+    with patch('pipeline.generate.XSDATA_FORMAT_OPTIONS', ['--slots', '--frozen']):
+        generate_dataclasses(str(simple_xsd_file), temp_dir=work_dir, keep_temp=True)
+    assert mock_run.call_count == 4
+    
+    # Nor is output from a different xsdata version
+    with patch('pipeline.generate.version', return_value='0.0.0'):
+        generate_dataclasses(str(simple_xsd_file), temp_dir=work_dir, keep_temp=True)
+    assert mock_run.call_count == 5
+
+
+@pytest.mark.unit
+def test_store_in_cache_stages_privately_and_tolerates_lost_race(
+    temp_test_dir: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test that each store uses its own staging dir and an existing entry wins quietly."""
+    from pipeline.generate import _store_in_cache
+    
+    package_dir = temp_test_dir / 'generated_dataclasses'
+    package_dir.mkdir()
+    (package_dir / 'simple.py').write_text('# ours\n')
+    cache_entry = temp_test_dir / 'cache' / 'key'
+    
+    # Another run published the entry between our copy and rename
+    cache_entry.mkdir(parents=True)
+    (cache_entry / 'simple.py').write_text('# theirs\n')
+    
+    with caplog.at_level('DEBUG', logger='pipeline.generate'):
+        _store_in_cache(package_dir, cache_entry)
+    
+    assert (cache_entry / 'simple.py').read_text() == '# theirs\n'
+    assert not [r for r in caplog.records if r.levelname == 'WARNING']
+    # No staging directories are left behind
+    assert sorted(p.name for p in cache_entry.parent.iterdir()) == ['key']
+    
+    fresh_entry = temp_test_dir / 'cache' / 'fresh'
+    _store_in_cache(package_dir, fresh_entry)
+    assert (fresh_entry / 'simple.py').read_text() == '# ours\n'
+    assert sorted(p.name for p in fresh_entry.parent.iterdir()) == ['fresh', 'key']
@@ -0,0 +1,62 @@
+"""
+Unit tests for the built-in output plugins.
+
+Tests that PydanticCodePlugin output is importable Python source.
+"""
+import importlib.util
+import pytest
+import sys
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, Optional, Type
+
+from xsdata.models.datatype import XmlDate
+
+from plugins import PydanticCodePlugin
+from utils.conversion import dataclass_to_pydantic_model
+
+
+class Colour(Enum):
+    RED = "red"
+    BLUE = "blue"
+
+
+@dataclass(kw_only=True)
+class Node:
+    name: str
+    colour: Colour = Colour.RED
+    created: Optional[XmlDate] = None
+    parent: Optional["Node"] = None
+    children: list["Node"] = field(default_factory=list)
+
+
+def _build_models() -> Dict[str, Type[Any]]:
+    """Convert the Node dataclass, resolving its self references."""
+    node_model = dataclass_to_pydantic_model(Node)
+    node_model.model_rebuild(_types_namespace={'Node': node_model})
+    return {'Node': node_model}
+
+
+@pytest.mark.unit
+def test_pydantic_code_plugin_output_imports(
+    temp_test_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that generated code imports its enum and xsdata types and rebuilds models."""
+    output_path = temp_test_dir / "plugin_models.py"
+    PydanticCodePlugin().generate(_build_models(), 'Node', output_path)
+    
+    source = output_path.read_text()
+    assert "from xsdata.models.datatype import XmlDate" in source
+    assert f"from {__name__} import Colour" in source
+    assert source.rstrip().endswith("Node.model_rebuild()")
+    
+    spec = importlib.util.spec_from_file_location("plugin_models", output_path)
+    assert spec is not None and spec.loader is not None
+    emitted = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, "plugin_models", emitted)
+    spec.loader.exec_module(emitted)
+    
+    node = emitted.Node.model_validate({'name': 'b', 'parent': {'name': 'a'}})
+    assert isinstance(node.parent, emitted.Node)
+    assert node.colour is Colour.RED
@@ -139,3 +139,34 @@ def test_generate_json_schema_list_fields(temp_test_dir: Path) -> None:
     # Should have array type for items
     items_prop = schema['properties']['items']
     assert items_prop['type'] == 'array'
+
+
+@pytest.mark.unit
+def test_generate_json_schema_serializes_decimal_defaults(temp_test_dir: Path) -> None:
+    """Test that non-JSON defaults such as Decimal are written as strings."""
+    from decimal import Decimal
+    
+    class Invoice(BaseModel):
+        total: Decimal = Decimal("9.99")
+    
+    schema_path = generate_json_schema({'Invoice': Invoice}, 'Invoice', temp_test_dir)
+    
+    with open(schema_path) as f:
+        schema = json.load(f)
+    assert schema['properties']['total']['default'] == "9.99"
+
+
+@pytest.mark.unit
+def test_generate_json_schema_replaces_stale_json_only(temp_test_dir: Path) -> None:
+    """Test that stale JSON files are removed but other outputs are kept."""
+    class Order(BaseModel):
+        order_id: str
+    
+    (temp_test_dir / "stale.json").write_text("{}")
+    (temp_test_dir / "pydantic_models.py").write_text("# models\n")
+    
+    generate_json_schema({'Order': Order}, 'Order', temp_test_dir)
+    
+    assert not (temp_test_dir / "stale.json").exists()
+    assert (temp_test_dir / "pydantic_models.py").exists()
+    assert sorted(p.name for p in temp_test_dir.glob("*.json")) == ["schema.json", "summary.json"]
@@ -0,0 +1,47 @@
+"""
+Unit tests for the serialization utilities.
+
+Tests JSON output with both orjson and the stdlib fallback.
+"""
+import pytest
+from pathlib import Path
+from decimal import Decimal
+import json
+
+from utils import serialization
+from utils.serialization import dumps_json, write_json
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_json_matches_stdlib(use_orjson: bool, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that output is indented JSON that round-trips, with or without orjson."""
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(serialization, "orjson", None)
+    
+    data = {"main_model": "Order", "models": ["Order", "Item"], "total_models": 2}
+    
+    output = dumps_json(data)
+    
+    assert output.decode('utf-8') == json.dumps(data, indent=2)
+
+
+@pytest.mark.unit
+def test_write_json_uses_default(temp_test_dir: Path) -> None:
+    """Test that the default callable handles unsupported values."""
+    path = temp_test_dir / "out.json"
+    
+    write_json(path, {"price": Decimal("1.50")}, default=str)
+    
+    assert json.loads(path.read_text()) == {"price": "1.50"}
+
+
+@pytest.mark.unit
+def test_dumps_json_custom_indent_and_ascii() -> None:
+    """Test that non-default formatting options use the stdlib encoder."""
+    data = {"name": "Café"}
+    
+    assert dumps_json(data, indent=None, ensure_ascii=True) == b'{"name": "Caf\\u00e9"}'
+    assert dumps_json(data, indent=4) == json.dumps(data, indent=4, ensure_ascii=False).encode('utf-8')
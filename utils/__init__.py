@@ -1,6 +1,16 @@
 """
 Utils package for shared conversion utilities.
 """
-from utils.conversion import dataclass_to_pydantic_model, inspect_dataclass_fields
+from utils.conversion import (
+    asdict_shallow,
+    dataclass_to_pydantic_model,
+    inspect_dataclass_fields,
+    pydantic_instance_from_dataclass
+)
 
-__all__ = ['dataclass_to_pydantic_model', 'inspect_dataclass_fields']
+__all__ = [
+    'asdict_shallow',
+    'dataclass_to_pydantic_model',
+    'inspect_dataclass_fields',
+    'pydantic_instance_from_dataclass'
+]
@@ -0,0 +1,61 @@
+"""
+Per-class memoization helpers.
+
+Generated models are created at runtime, and a CLI or test process may run the
+pipeline many times. Caches keyed by class therefore hold their keys weakly, so
+a model class and everything derived from it is released once the caller drops
+the class.
+"""
+import functools
+import threading
+from typing import Any, Callable, Generic, TypeVar
+from weakref import WeakKeyDictionary
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+
+class WeakClassCache(Generic[K, V]):
+    """
+    Memoize a one-argument function per class without keeping the class alive.
+    
+    Use as a decorator in place of functools.lru_cache(maxsize=None) for
+    functions whose only argument is a class. Cached values must not refer back
+    to the class, or the entry keeps its own key alive.
+    
+    Example:
+        >>> @WeakClassCache
+        ... def field_count(cls: type) -> int:
+        ...     return len(vars(cls))
+    """
+    
+    def __init__(self, func: Callable[[K], V]) -> None:
+        """
+        Wrap func with a weakly keyed cache.
+        
+        Args:
+            func: Function of a single class argument to memoize
+        """
+        self._func: Callable[[K], V] = func
+        self._cache: 'WeakKeyDictionary[Any, V]' = WeakKeyDictionary()
+        self._lock: threading.Lock = threading.Lock()
+        functools.update_wrapper(self, func)
+    
+    def __call__(self, cls: K) -> V:
+        """Return the cached result for cls, computing it on first use."""
+        try:
+            return self._cache[cls]
+        except KeyError:
+            pass
+        value: V = self._func(cls)
+        with self._lock:
+            return self._cache.setdefault(cls, value)
+    
+    def cache_clear(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._cache.clear()
+    
+    def __len__(self) -> int:
+        """Number of classes currently cached."""
+        return len(self._cache)
@@ -4,11 +4,20 @@ Configuration management module.
 Supports loading configuration from YAML and TOML files to provide
 default values for CLI options.
 """
+import copy
 import logging
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Final, FrozenSet, Optional, Tuple
 import yaml
 
+try:
+    # libyaml-backed loader when PyYAML was built with it
+    from yaml import CSafeLoader as _YAMLLoader
+except ImportError:
+    from yaml import SafeLoader as _YAMLLoader
+
 try:
     import tomllib  # Python 3.11+
 except ImportError:
@@ -16,6 +25,76 @@ except ImportError:
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+# Config file names, in lookup priority order within a directory
+CONFIG_NAMES: Final[Tuple[str, ...]] = (
+    '.zeep-codegen.yaml',
+    '.zeep-codegen.yml',
+    '.zeep-codegen.toml'
+)
+_CONFIG_NAME_SET: Final[FrozenSet[str]] = frozenset(CONFIG_NAMES)
+
+
+@lru_cache(maxsize=16)
+def _parse_config_file(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Parse a YAML or TOML config file.
+    
+    mtime_ns and size only form part of the cache key, so an edited file is
+    parsed again. Callers must copy the result before modifying it.
+    
+    Args:
+        path: Absolute, resolved path to the config file
+        mtime_ns: File modification time in nanoseconds
+        size: File size in bytes
+    
+    Returns:
+        Parsed configuration dictionary (shared, do not modify)
+    
+    Raises:
+        ValueError: If config file format is unsupported
+    """
+    config_path = Path(path)
+    suffix = config_path.suffix.lower()
+    
+    data: Dict[str, Any]
+    if suffix in ['.yaml', '.yml']:
+        with open(config_path, 'r') as f:
+            data = yaml.load(f, Loader=_YAMLLoader) or {}
+        logger.info(f"Loaded YAML config from {config_path}")
+    elif suffix == '.toml':
+        with open(config_path, 'rb') as f:
+            data = tomllib.load(f)
+        logger.info(f"Loaded TOML config from {config_path}")
+    else:
+        raise ValueError(f"Unsupported config file format: {suffix}")
+    
+    return data
+
+
+def _find_config_in(directory: Path) -> Optional[Path]:
+    """
+    Return the highest-priority config file in directory, if any.
+    
+    Args:
+        directory: Directory to look in
+    
+    Returns:
+        Path to the config file, or None if the directory has none or cannot be read
+    """
+    try:
+        with os.scandir(directory) as entries:
+            found: FrozenSet[str] = frozenset(
+                entry.name for entry in entries
+                if entry.name in _CONFIG_NAME_SET and entry.is_file()
+            )
+    except OSError:
+        return None
+    
+    for config_name in CONFIG_NAMES:
+        if config_name in found:
+            return directory / config_name
+    return None
+
 
 class Config:
     """
@@ -71,28 +150,28 @@ class Config:
             FileNotFoundError: If config file doesn't exist
             ValueError: If config file format is unsupported
         
+        Note:
+            Parsed contents are cached by (path, mtime, size), so loading an
+            unchanged file again costs a single stat() call.
+        
         Example:
             >>> config = Config.load_from_file(Path('.zeep-codegen.yaml'))
             >>> print(config.get('output_dir'))
             ./generated
         """
-        if not config_path.exists():
-            raise FileNotFoundError(f"Config file not found: {config_path}")
+        try:
+            resolved_path: Path = Path(config_path).resolve(strict=True)
+            stat_result: os.stat_result = os.stat(resolved_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Config file not found: {config_path}") from None
         
-        suffix = config_path.suffix.lower()
-        
-        if suffix in ['.yaml', '.yml']:
-            with open(config_path, 'r') as f:
-                data = yaml.safe_load(f) or {}
-            logger.info(f"Loaded YAML config from {config_path}")
-        elif suffix == '.toml':
-            with open(config_path, 'rb') as f:
-                data = tomllib.load(f)
-            logger.info(f"Loaded TOML config from {config_path}")
-        else:
-            raise ValueError(f"Unsupported config file format: {suffix}")
-        
-        return cls(data)
+        # Parsed once per file version, keyed by absolute path so a relative
+        # path cannot hit another directory's entry after a cwd change; each
+        # Config gets its own copy to mutate
+        data = _parse_config_file(
+            str(resolved_path), stat_result.st_mtime_ns, stat_result.st_size
+        )
+        return cls(copy.deepcopy(data))
     
     @classmethod
     def discover(cls, start_path: Optional[Path] = None) -> Optional['Config']:
@@ -116,21 +195,15 @@ class Config:
         if start_path is None:
             start_path = Path.cwd()
         
-        config_names = [
-            '.zeep-codegen.yaml',
-            '.zeep-codegen.yml',
-            '.zeep-codegen.toml'
-        ]
-        
         current_dir = start_path
         
-        # Search up to root directory
+        # Search up to root directory, listing each directory once rather than
+        # stat()ing every candidate name
         while True:
-            for config_name in config_names:
-                config_path = current_dir / config_name
-                if config_path.exists():
-                    logger.info(f"Discovered config file: {config_path}")
-                    return cls.load_from_file(config_path)
+            config_path = _find_config_in(current_dir)
+            if config_path is not None:
+                logger.info(f"Discovered config file: {config_path}")
+                return cls.load_from_file(config_path)
             
             # Move to parent directory
             parent = current_dir.parent
@@ -5,9 +5,100 @@ This module contains common logic used by the conversion pipeline to avoid dupli
 It provides functions for dynamically creating Pydantic models from dataclass types
 using introspection and Pydantic's create_model() API.
 """
+import logging
+import re
+import types
 from dataclasses import fields, is_dataclass, MISSING, Field
-from typing import Any, Type, Tuple, List, Optional, get_type_hints, Dict
-from pydantic import create_model
+from enum import Enum
+from functools import lru_cache
+from graphlib import CycleError, TopologicalSorter
+from typing import (
+    Any, Type, Tuple, List, Optional, get_type_hints, Dict, Final, ForwardRef, Union,
+    get_args, get_origin
+)
+from pydantic import BaseModel, ConfigDict, Field as PydanticField, create_model
+
+from utils.caching import WeakClassCache
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# Generated models have a fixed shape and are built from already-validated data:
+# reject unknown keys, skip assignment validation and allow model_validate(obj)
+# straight from xsdata dataclass instances via attribute access.
+MODEL_CONFIG: Final[ConfigDict] = ConfigDict(
+    frozen=True,
+    extra='forbid',
+    validate_assignment=False,
+    from_attributes=True
+)
+
+# Fixed imports at the top of every generated models module. Postponed
+# annotations let models refer to themselves and to models defined later.
+GENERATED_MODULE_IMPORTS: Final[str] = (
+    'from __future__ import annotations\n\n'
+    'from pydantic import BaseModel, ConfigDict, Field\n'
+    'from typing import Optional, List\n'
+    'from decimal import Decimal\n'
+    'from datetime import datetime, date\n'
+    'from enum import Enum\n'
+)
+# Name -> providing module for everything GENERATED_MODULE_IMPORTS binds
+_GENERATED_HEADER_NAMES: Final[Dict[str, str]] = {
+    'BaseModel': 'pydantic',
+    'ConfigDict': 'pydantic',
+    'Field': 'pydantic',
+    'Optional': 'typing',
+    'List': 'typing',
+    'Decimal': 'decimal',
+    'datetime': 'datetime',
+    'date': 'datetime',
+    'Enum': 'enum',
+}
+# Alias the dataclass module is imported under in generated source
+SOURCE_MODULE_ALIAS: Final[str] = '_source'
+
+# Module prefix stripped from annotation reprs that have no structured rendering
+_TYPING_PREFIX_RE: Final[re.Pattern[str]] = re.compile(r'\btyping\.')
+
+
+@WeakClassCache
+def _field_table(dataclass_type: Type[Any]) -> Tuple[Tuple[str, Any, Any, bool], ...]:
+    """
+    Build the (field_name, field_type, default_value, is_factory) table for a dataclass once.
+    
+    The table is cached per class (held weakly) so repeated conversions and
+    inspections skip the dataclasses.fields() reflection walk.
+    
+    Args:
+        dataclass_type: The dataclass type to inspect
+    
+    Returns:
+        Tuple of (field_name, field_type, default_value, is_factory) tuples, where
+        default_value is ... for required fields and the factory itself for
+        default_factory fields
+    """
+    table: List[Tuple[str, Any, Any, bool]] = []
+    for field in fields(dataclass_type):
+        # Get default value if it exists
+        default_value: Any
+        is_factory: bool = False
+        if field.default is not MISSING:
+            default_value = field.default
+        elif field.default_factory is not MISSING:
+            default_value = field.default_factory
+            is_factory = True
+        else:
+            default_value = ...  # Required field in Pydantic
+        
+        table.append((field.name, field.type, default_value, is_factory))
+    
+    return tuple(table)
+
+
+@WeakClassCache
+def _field_names(dataclass_type: Any) -> Tuple[str, ...]:
+    """Return the cached tuple of field names for a dataclass."""
+    return tuple(field_name for field_name, _, _, _ in _field_table(dataclass_type))
 
 
 def dataclass_to_pydantic_model(
@@ -52,41 +143,85 @@ def dataclass_to_pydantic_model(
     if model_name is None:
         model_name = dataclass_type.__name__
     
-    # Extract field information from the dataclass
-    field_info: List[Tuple[str, Any, Any]] = []
-    for field in fields(dataclass_type):
-        field_name: str = field.name
-        field_type: Any = field.type
-        
-        # Get default value if it exists
-        default_value: Any
-        if field.default is not MISSING:
-            default_value = field.default
-        elif field.default_factory is not MISSING:
-            # For Pydantic, we need the factory function itself, not the result
-            # Pydantic will handle calling it
-            default_value = field.default_factory
-        else:
-            default_value = ...  # Required field in Pydantic
-        
-        field_info.append((field_name, field_type, default_value))
-    
-    # Build Pydantic field definitions
+    # Build Pydantic field definitions from the cached field table
     pydantic_fields: Dict[str, Any] = {}
-    for field_name, field_type, default_value in field_info:
+    for field_name, field_type, default_value, is_factory in _field_table(dataclass_type):
         if default_value is ...:
             # Required field
             pydantic_fields[field_name] = (field_type, ...)
+        elif is_factory:
+            # Let Pydantic call the factory per instance
+            pydantic_fields[field_name] = (
+                field_type, PydanticField(default_factory=default_value)
+            )
         else:
             # Optional or has default
             pydantic_fields[field_name] = (field_type, default_value)
     
     # Create the Pydantic model dynamically
-    pydantic_model: Type[Any] = create_model(model_name, **pydantic_fields)
+    pydantic_model: Type[Any] = create_model(
+        model_name, __config__=MODEL_CONFIG, **pydantic_fields
+    )
     
     return pydantic_model
 
 
+def resolve_forward_refs(model: Type[Any], namespace: Dict[str, Any]) -> None:
+    """
+    Replace string forward references in a model's fields with concrete types.
+    
+    xsdata emits postponed annotations, so fields referring to other models are
+    left as ForwardRef by create_model() and order_models_by_dependency() would
+    see no references at all. Evaluating them against the shared namespace
+    exposes the references so models can be rebuilt dependencies first.
+    
+    This only feeds the dependency ordering: model_rebuild(force=True)
+    recomputes every FieldInfo from the original annotations afterwards.
+    
+    Args:
+        model: Pydantic model whose fields should be resolved in place
+        namespace: Names available to the annotations (types and models)
+    
+    Note:
+        References that fail with NameError or TypeError are left as
+        ForwardRef for model_rebuild() to report; other errors propagate.
+    """
+    # eval() inserts __builtins__ into its globals, so work on a copy
+    globalns: Dict[str, Any] = dict(namespace)
+    for field_info in model.model_fields.values():
+        annotation: Any = field_info.annotation
+        if not isinstance(annotation, ForwardRef):
+            continue
+        try:
+            field_info.annotation = eval(annotation.__forward_arg__, globalns)
+        except (NameError, TypeError):
+            continue
+
+
+def cached_json_schema(model: Type[Any]) -> Dict[str, Any]:
+    """
+    Return a model's JSON Schema, generating it once per model class.
+    
+    model_json_schema() walks the whole model graph, so the pipeline and the
+    plugins share one result per class. The returned dict is shared between
+    callers and must not be modified.
+    
+    Args:
+        model: Pydantic model class
+    
+    Returns:
+        JSON Schema dictionary for the model
+    """
+    return _json_schema(model)
+
+
+@WeakClassCache
+def _json_schema(model: Type[BaseModel]) -> Dict[str, Any]:
+    """Cached model_json_schema() call backing cached_json_schema()."""
+    schema: Dict[str, Any] = model.model_json_schema()
+    return schema
+
+
 def inspect_dataclass_fields(dataclass_type: Type[Any]) -> List[Tuple[str, Any, Any]]:
     """
     Inspect a dataclass and extract field information.
@@ -103,20 +238,377 @@ def inspect_dataclass_fields(dataclass_type: Type[Any]) -> List[Tuple[str, Any,
     if not is_dataclass(dataclass_type):
         raise ValueError(f"{dataclass_type} is not a dataclass")
     
-    field_info: List[Tuple[str, Any, Any]] = []
-    for field in fields(dataclass_type):
-        field_name: str = field.name
-        field_type: Any = field.type
-        
-        # Get default value if it exists
-        default_value: Any
-        if field.default is not MISSING:
-            default_value = field.default
-        elif field.default_factory is not MISSING:
-            default_value = field.default_factory
-        else:
-            default_value = ...  # Required field in Pydantic
-        
-        field_info.append((field_name, field_type, default_value))
+    return [
+        (field_name, field_type, default_value)
+        for field_name, field_type, default_value, _ in _field_table(dataclass_type)
+    ]
+
+
+def asdict_shallow(instance: Any) -> Dict[str, Any]:
+    """
+    Map a dataclass instance's field names to its current values.
+    
+    Unlike dataclasses.asdict(), nested dataclasses and containers are not
+    recursed into or copied, and field names come from a per-class cache instead
+    of dataclasses.fields() reflection on every call.
+    
+    Args:
+        instance: Dataclass instance to read
+    
+    Returns:
+        Dictionary of field name to value
+    
+    Raises:
+        ValueError: If the input is not a dataclass instance
+    """
+    if not is_dataclass(instance) or isinstance(instance, type):
+        raise ValueError(f"{instance!r} is not a dataclass instance")
+    
+    return {
+        field_name: getattr(instance, field_name)
+        for field_name in _field_names(type(instance))
+    }
+
+
+def pydantic_instance_from_dataclass(
+    instance: Any,
+    pydantic_models: Dict[str, Type[Any]]
+) -> Any:
+    """
+    Build a Pydantic model instance from a populated dataclass instance.
+    
+    The dataclass layer has already been validated (e.g. parsed by xsdata), so the
+    Pydantic instance is created with model_construct() instead of re-running
+    validation. Nested dataclass instances, including those inside lists, are
+    converted recursively using the model registered under their class name.
+    
+    Args:
+        instance: Dataclass instance to convert
+        pydantic_models: Dictionary mapping model names to Pydantic model classes,
+                         as returned by convert_to_pydantic()
+    
+    Returns:
+        Instance of the Pydantic model matching the dataclass name
+    
+    Raises:
+        ValueError: If the input is not a dataclass instance
+        KeyError: If no Pydantic model is registered for the dataclass name
+    
+    Example:
+        >>> models, _ = convert_to_pydantic('generated_dataclasses.order', Path('.temp'))
+        >>> order_model = pydantic_instance_from_dataclass(order, models)
+    """
+    if not is_dataclass(instance) or isinstance(instance, type):
+        raise ValueError(f"{instance!r} is not a dataclass instance")
+    
+    dataclass_type: Any = type(instance)
+    model: Type[Any] = pydantic_models[dataclass_type.__name__]
+    values: Dict[str, Any] = {
+        field_name: _to_model_value(value, pydantic_models)
+        for field_name, value in asdict_shallow(instance).items()
+    }
+    return model.model_construct(**values)
+
+
+def _to_model_value(value: Any, pydantic_models: Dict[str, Type[Any]]) -> Any:
+    """Convert nested dataclass values for pydantic_instance_from_dataclass()."""
+    if is_dataclass(value) and not isinstance(value, type):
+        return pydantic_instance_from_dataclass(value, pydantic_models)
+    if isinstance(value, list):
+        return [_to_model_value(item, pydantic_models) for item in value]
+    return value
+
+
+def format_annotation(annotation: Any) -> str:
+    """
+    Render a type annotation as Python source.
+    
+    Classes are emitted by bare name (they are imported or defined in the generated
+    module), Optional unions as Optional[X] and generics as name[args], so the
+    output is valid source rather than a repr such as <class 'str'>.
+    
+    Args:
+        annotation: Resolved annotation, typically FieldInfo.annotation
+    
+    Returns:
+        Source code for the annotation
+    
+    Example:
+        >>> format_annotation(Optional[List[Decimal]])
+        'Optional[list[Decimal]]'
+    """
+    # The same annotations recur across every model in a schema, so memoize
+    # per annotation object; unhashable annotations are rendered directly.
+    try:
+        return _format_annotation_cached(annotation)
+    except TypeError:
+        return _format_annotation(annotation)
+
+
+# Annotation objects (Optional[Model], list[Model], ...) cannot be weakly
+# referenced, so this cache is bounded rather than keyed weakly
+ANNOTATION_CACHE_SIZE: Final[int] = 1024
+
+
+@lru_cache(maxsize=ANNOTATION_CACHE_SIZE)
+def _format_annotation_cached(annotation: Any) -> str:
+    """Cached wrapper around _format_annotation() for hashable annotations."""
+    return _format_annotation(annotation)
+
+
+def _format_annotation(annotation: Any) -> str:
+    """Render an annotation as source; see format_annotation()."""
+    if annotation is None or annotation is type(None):
+        return 'None'
+    if isinstance(annotation, str):
+        return annotation
+    if isinstance(annotation, ForwardRef):
+        return annotation.__forward_arg__
+    
+    origin: Any = get_origin(annotation)
+    args: Tuple[Any, ...] = get_args(annotation)
+    
+    if origin is Union or origin is types.UnionType:
+        members: List[Any] = [arg for arg in args if arg is not type(None)]
+        if len(members) == 1 and len(members) < len(args):
+            return f"Optional[{format_annotation(members[0])}]"
+        return ' | '.join(format_annotation(arg) for arg in args)
+    
+    if origin is not None and isinstance(origin, type) and args:
+        rendered_args: str = ', '.join(format_annotation(arg) for arg in args)
+        return f"{origin.__name__}[{rendered_args}]"
+    
+    if isinstance(annotation, type):
+        return annotation.__name__
+    
+    return _TYPING_PREFIX_RE.sub('', str(annotation))
+
+
+def format_default(default: Any) -> str:
+    """
+    Render a field default value as Python source.
+    
+    Args:
+        default: Default value from FieldInfo.default
+    
+    Returns:
+        Source code for the default (Enum members as Type.MEMBER, others via repr)
+    """
+    if isinstance(default, Enum):
+        return f"{type(default).__name__}.{default.name}"
+    return repr(default)
+
+
+def format_model_config(config: ConfigDict = MODEL_CONFIG) -> str:
+    """
+    Render a model_config assignment as a class-body source line.
+    
+    Args:
+        config: Configuration to render (default: MODEL_CONFIG)
+    
+    Returns:
+        Indented source line, e.g. "    model_config = ConfigDict(frozen=True)"
+    """
+    options: str = ', '.join(f"{key}={value!r}" for key, value in config.items())
+    return f"    model_config = ConfigDict({options})"
+
+
+def format_field(field_name: str, field_info: Any) -> str:
+    """
+    Render one Pydantic field as a class-body source line.
+    
+    Args:
+        field_name: Name of the field
+        field_info: Pydantic FieldInfo for the field
+    
+    Returns:
+        Indented source line, e.g. "    items: list[Item] = Field(default_factory=list)"
+    """
+    field_type: str = format_annotation(field_info.annotation)
+    if field_info.is_required():
+        return f"    {field_name}: {field_type}"
+    if field_info.default_factory is not None:
+        factory: Any = field_info.default_factory
+        factory_name: str = getattr(factory, '__name__', repr(factory))
+        return f"    {field_name}: {field_type} = Field(default_factory={factory_name})"
+    if field_info.default is None:
+        return f"    {field_name}: {field_type} = None"
+    return f"    {field_name}: {field_type} = {format_default(field_info.default)}"
+
+
+def render_model_class(name: str, model: Type[Any]) -> str:
+    """
+    Render a Pydantic model as a class definition in generated source.
+    
+    Args:
+        name: Class name to emit
+        model: Pydantic model class to describe
+    
+    Returns:
+        Class source including model_config and one line per field, ending
+        with a blank line
+    """
+    lines: List[str] = [f"class {name}(BaseModel):", format_model_config()]
+    field_lines: Tuple[str, ...] = _field_lines(model)
+    if field_lines:
+        lines.append('')
+        lines.extend(field_lines)
+    lines.append('')
+    return '\n'.join(lines) + '\n'
+
+
+@WeakClassCache
+def _field_lines(model: Type[BaseModel]) -> Tuple[str, ...]:
+    """
+    Snapshot a model's formatted field lines once per model class.
+    
+    The convert step and PydanticCodePlugin render the same models, so the
+    field walk and annotation/default formatting is shared between them.
+    """
+    return tuple(
+        format_field(field_name, field_info)
+        for field_name, field_info in model.model_fields.items()
+    )
+
+
+def render_type_imports(
+    pydantic_models: Dict[str, Type[Any]],
+    source_module: Optional[str] = None
+) -> str:
+    """
+    Render imports for the non-model types that model fields refer to.
+    
+    Enums and xsdata datatypes such as XmlDate are imported by name instead of
+    star-importing the dataclass module, so nothing in it can shadow the
+    pydantic names or the models of the generated module. Types from
+    source_module are bound through a module alias (SOURCE_MODULE_ALIAS).
+    Names that would clash with the fixed header or a model are skipped with a
+    warning.
+    
+    Args:
+        pydantic_models: Dictionary mapping model names to Pydantic model classes
+        source_module: Dotted name of the dataclass module the models came from
+    
+    Returns:
+        Import and binding lines, each ending in a newline (empty if none needed)
+    """
+    models = set(pydantic_models.values())
+    qualnames_by_module: Dict[str, Dict[str, str]] = {}
+    for model in pydantic_models.values():
+        for field_info in model.model_fields.values():
+            for referenced in _referenced_types(field_info.annotation):
+                name: str = referenced.__name__
+                module: str = referenced.__module__
+                if referenced in models or module == 'builtins':
+                    continue
+                if _GENERATED_HEADER_NAMES.get(name) == module:
+                    continue
+                if name in _GENERATED_HEADER_NAMES or name in pydantic_models:
+                    logger.warning(
+                        f"Not importing {module}.{referenced.__qualname__}: "
+                        f"'{name}' is already defined in the generated module"
+                    )
+                    continue
+                qualnames_by_module.setdefault(module, {})[name] = referenced.__qualname__
+    
+    imports: List[str] = []
+    bindings: List[str] = []
+    for module, qualnames in sorted(qualnames_by_module.items()):
+        if module == source_module:
+            imports.append(f"import {module} as {SOURCE_MODULE_ALIAS}\n")
+            bindings.extend(
+                f"{name} = {SOURCE_MODULE_ALIAS}.{qualname}\n"
+                for name, qualname in sorted(qualnames.items())
+            )
+            continue
+        top_level: List[str] = sorted(
+            name for name, qualname in qualnames.items() if name == qualname
+        )
+        if top_level:
+            imports.append(f"from {module} import {', '.join(top_level)}\n")
+        nested: List[Tuple[str, str]] = sorted(
+            (name, qualname) for name, qualname in qualnames.items() if name != qualname
+        )
+        if nested:
+            imports.append(f"import {module}\n")
+            bindings.extend(f"{name} = {module}.{qualname}\n" for name, qualname in nested)
+    return ''.join(imports + bindings)
+
+
+def _referenced_types(annotation: Any) -> List[type]:
+    """Collect the classes referenced anywhere inside an annotation."""
+    if get_origin(annotation) is None and isinstance(annotation, type):
+        return [annotation]
+    referenced: List[type] = []
+    for arg in get_args(annotation):
+        referenced.extend(_referenced_types(arg))
+    return referenced
+
+
+def render_model_rebuilds(names: List[str]) -> str:
+    """
+    Render the model_rebuild() calls that close a generated models module.
+    
+    With postponed annotations, a model referring to one defined later (or to
+    a cycle) is left incomplete at class creation; rebuilding every class once
+    the module body has run resolves those references.
+    
+    Args:
+        names: Class names defined in the generated module, in definition order
+    
+    Returns:
+        One "Name.model_rebuild()" line per class (empty if there are none)
+    """
+    return ''.join(f"{name}.model_rebuild()\n" for name in names)
+
+
+def order_models_by_dependency(
+    pydantic_models: Dict[str, Type[Any]],
+    aliases: Optional[Dict[str, str]] = None
+) -> List[str]:
+    """
+    Order model names so every model comes after the models its fields reference.
+    
+    Emitting generated source in this order makes each annotation bind to the
+    Pydantic class defined earlier in the file. Recursive schemas cannot be
+    ordered; in that case the original order is kept.
+    
+    Args:
+        pydantic_models: Dictionary mapping model names to Pydantic model classes
+        aliases: Optional mapping of alias name to target model name; each alias
+                 is ordered after its target
+    
+    Returns:
+        List of model names in dependency order
+    """
+    name_by_model: Dict[Any, str] = {
+        model: name for name, model in pydantic_models.items()
+    }
+    sorter: TopologicalSorter[str] = TopologicalSorter()
+    for name, model in pydantic_models.items():
+        dependencies: List[str] = []
+        for field_info in model.model_fields.values():
+            dependencies.extend(_referenced_models(field_info.annotation, name_by_model))
+        if aliases and name in aliases:
+            dependencies.append(aliases[name])
+        sorter.add(name, *(dep for dep in dependencies if dep != name))
+    
+    try:
+        return list(sorter.static_order())
+    except CycleError:
+        return list(pydantic_models)
+
+
+def _referenced_models(annotation: Any, name_by_model: Dict[Any, str]) -> List[str]:
+    """Collect names of known models referenced anywhere inside an annotation."""
+    try:
+        if annotation in name_by_model:
+            return [name_by_model[annotation]]
+    except TypeError:
+        # Unhashable annotation objects cannot be models
+        pass
     
-    return field_info
+    referenced: List[str] = []
+    for arg in get_args(annotation):
+        referenced.extend(_referenced_models(arg, name_by_model))
+    return referenced
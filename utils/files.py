@@ -0,0 +1,68 @@
+"""
+File writing helpers for pipeline output.
+
+Outputs are written to a temporary file beside the destination and moved into
+place with os.replace(), so an interrupted run never leaves a truncated file
+that a later step would read as valid.
+"""
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+
+def _temp_path(path: Path) -> Path:
+    """Return a sibling temp path unique to this process and thread."""
+    return path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+
+@contextmanager
+def atomic_open(path: Path) -> Iterator[BinaryIO]:
+    """
+    Open path for binary writing, replacing it only once writing succeeds.
+    
+    Args:
+        path: Destination file
+    
+    Yields:
+        Binary file object for the temporary file
+    
+    Example:
+        >>> with atomic_open(Path('out.xsd')) as f:
+        ...     f.write(b'<xs:schema/>')
+    """
+    path = Path(path)
+    temp_path: Path = _temp_path(path)
+    try:
+        with open(temp_path, 'wb') as f:
+            yield f
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """
+    Write bytes to path atomically.
+    
+    Args:
+        path: Destination file
+        data: File contents
+    """
+    with atomic_open(path) as f:
+        f.write(data)
+
+
+def atomic_write_text(path: Path, text: str, encoding: str = 'utf-8') -> None:
+    """
+    Write text to path atomically, with '\\n' line endings on every platform.
+    
+    Args:
+        path: Destination file
+        text: File contents
+        encoding: Text encoding (default: utf-8)
+    """
+    atomic_write_bytes(path, text.encode(encoding))
+
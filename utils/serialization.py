@@ -0,0 +1,62 @@
+"""
+JSON serialization helpers for pipeline output files.
+
+Uses orjson when it is installed (pip install "python-zeep-codegen[fast]"),
+falling back to the standard library json module otherwise. Output is
+indented with two spaces either way.
+"""
+import json
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from utils.files import atomic_write_bytes
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps_json(
+    data: Any,
+    default: Optional[Callable[[Any], Any]] = None,
+    indent: Optional[int] = 2,
+    ensure_ascii: bool = False
+) -> bytes:
+    """
+    Serialize data to JSON bytes.
+    
+    orjson only supports two-space indentation and UTF-8 output, so other
+    indent or ensure_ascii settings use the standard library encoder.
+    
+    Args:
+        data: JSON-compatible object to serialize
+        default: Optional callable for objects the encoder cannot handle
+        indent: Spaces per indentation level, or None for compact output
+        ensure_ascii: If True, escape all non-ASCII characters
+    
+    Returns:
+        UTF-8 encoded JSON document
+    """
+    if orjson is not None and indent == 2 and not ensure_ascii:
+        return orjson.dumps(data, default=default, option=orjson.OPT_INDENT_2)
+    return json.dumps(
+        data, indent=indent, ensure_ascii=ensure_ascii, default=default
+    ).encode('utf-8')
+
+
+def write_json(
+    path: Path,
+    data: Any,
+    default: Optional[Callable[[Any], Any]] = None
+) -> None:
+    """
+    Serialize data and write it to path atomically in a single call.
+    
+    Args:
+        path: Destination file
+        data: JSON-compatible object to serialize
+        default: Optional callable for objects the encoder cannot handle
+    """
+    atomic_write_bytes(path, dumps_json(data, default=default))
+
@@ -54,6 +54,21 @@ logger: logging.Logger = logging.getLogger(__name__)
     is_flag=True,
     help='Keep temporary directory with generated dataclasses (for debugging)'
 )
+@click.option(
+    '--decimal-as-float',
+    is_flag=True,
+    help='Map xs:decimal fields to float instead of Decimal (faster, less precise)'
+)
+@click.option(
+    '--cache-dir',
+    type=click.Path(file_okay=False),
+    help='Reuse xsdata output cached in this directory when the schema is unchanged'
+)
+@click.option(
+    '--force-regenerate',
+    is_flag=True,
+    help='Run xsdata even if kept dataclasses are newer than the schema'
+)
 @click.option(
     '--verbose', '-v',
     is_flag=True,
@@ -69,6 +84,9 @@ def main(
     main_model: str,
     output_dir: Optional[str],
     keep_temp: bool,
+    decimal_as_float: bool,
+    cache_dir: Optional[str],
+    force_regenerate: bool,
     verbose: bool,
     config: Optional[str]
 ) -> None:
@@ -108,6 +126,10 @@ def main(
       
         python wsdl_to_schema.py input.xsd --main-model Order --config my-config.yaml
       
+      Reuse generated dataclasses across runs:
+      
+        python wsdl_to_schema.py input.xsd --main-model Order --cache-dir ~/.cache/zeep-codegen
+      
       Enable verbose logging:
       
         python wsdl_to_schema.py input.xsd --main-model Order --verbose
@@ -134,6 +156,10 @@ def main(
             output_dir = cfg.get('output_dir')
         if not keep_temp:
             keep_temp = bool(cfg.get('keep_temp', False))
+        if not decimal_as_float:
+            decimal_as_float = bool(cfg.get('decimal_as_float', False))
+        if cache_dir is None and cfg.get('cache_dir'):
+            cache_dir = cfg.get('cache_dir')
         if not verbose:
             verbose = bool(cfg.get('verbose', False))
     
@@ -188,7 +214,9 @@ def main(
         module_name: str
         module_name, temp_dir = generate_dataclasses(
             str(input_file), 
-            keep_temp=keep_temp
+            keep_temp=keep_temp,
+            cache_dir=Path(cache_dir).expanduser() if cache_dir else None,
+            force_regenerate=force_regenerate
         )
         
         # Step 2: Convert to Pydantic models
@@ -196,7 +224,8 @@ def main(
         click.echo("Step 2: Converting Dataclasses to Pydantic Models")
         click.echo(f"{'='*70}")
         pydantic_models, models_file = convert_to_pydantic(
-            module_name, temp_dir, final_output_dir
+            module_name, temp_dir, final_output_dir,
+            decimal_as_float=decimal_as_float
         )
         
         # Step 3: Generate JSON Schema